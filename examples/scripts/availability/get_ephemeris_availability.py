@@ -1,29 +1,54 @@
 import pyaurorax
 import datetime
+import asyncio
+import functools
+
+# use uvloop for the event loop if it's installed (faster than the default
+# event loop, but it isn't available on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ModuleNotFoundError:
+    pass
+
+
+async def get_availability(start_date, end_date, program, platform, instrument_type):
+    # get availability without blocking the event loop, so that several
+    # requests can be in flight at the same time
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(pyaurorax.availability.ephemeris,
+                                                              start_date,
+                                                              end_date,
+                                                              program=program,
+                                                              platform=platform,
+                                                              instrument_type=instrument_type,
+                                                              format=pyaurorax.FORMAT_IDENTIFIER_ONLY))
 
 
 def main():
     # set parameters
     start_date = datetime.datetime(2019, 1, 1)
     end_date = datetime.date(2019, 1, 10)
-    program = "swarm"
-    platform = "swarma"
-    instrument_type = "footprint"
+    sources = [
+        ("swarm", "swarma", "footprint"),
+        ("swarm", "swarmb", "footprint"),
+        ("swarm", "swarmc", "footprint"),
+    ]
     print("Retrieving ephemeris availability with the parameters:")
     print("  Start Date:\t\t%s" % (start_date.strftime("%Y-%m-%d")))
     print("  End Date:\t\t%s" % (end_date.strftime("%Y-%m-%d")))
-    print("  Program:\t\t%s" % (program))
-    print("  Platform:\t\t%s" % (platform))
-    print("  Instrument Type:\t%s\n" % (instrument_type))
-
-    # get availability
-    availability = pyaurorax.availability.ephemeris(start_date,
-                                                    end_date,
-                                                    program=program,
-                                                    platform=platform,
-                                                    instrument_type=instrument_type,
-                                                    format=pyaurorax.FORMAT_IDENTIFIER_ONLY)
-    print(availability)
+    for program, platform, instrument_type in sources:
+        print("  Program:\t\t%s" % (program))
+        print("  Platform:\t\t%s" % (platform))
+        print("  Instrument Type:\t%s\n" % (instrument_type))
+
+    # get availability for all the sources concurrently
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(asyncio.gather(*[get_availability(start_date, end_date, *source)
+                                                       for source in sources]))
+    for availability in results:
+        for av in availability:
+            print(av.json())
 
 
 # ----------
@@ -1,31 +1,52 @@
 import pyaurorax
 import datetime
-import time
+import asyncio
 import pprint
 
+# use uvloop for the event loop if it's installed (faster than the default
+# event loop, but it isn't available on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ModuleNotFoundError:
+    pass
+
+
+async def wait_for_search(s, poll_interval=1.0):
+    # poll the request status without blocking the event loop, so that
+    # several searches can be waited on at the same time
+    loop = asyncio.get_event_loop()
+    while (s.completed is False):
+        await asyncio.sleep(poll_interval)
+        await loop.run_in_executor(None, s.update_status)
+
 
 def main():
-    # start search
-    print("Executing request ...")
-    s = pyaurorax.data_products.Search(datetime.datetime(2020, 1, 1, 0, 0, 0),
-                                       datetime.datetime(2020, 1, 1, 23, 59, 59),
-                                       programs=["auroramax"])
-    s.execute()
+    # start searches
+    print("Executing requests ...")
+    searches = []
+    for day in [1, 2]:
+        s = pyaurorax.data_products.Search(datetime.datetime(2020, 1, day, 0, 0, 0),
+                                           datetime.datetime(2020, 1, day, 23, 59, 59),
+                                           programs=["auroramax"])
+        s.execute()
+        searches.append(s)
 
     # get status
     print("Getting request status ...")
-    s.update_status()
-    pprint.pprint(s.status)
+    for s in searches:
+        s.update_status()
+        pprint.pprint(s.status)
     print("----------------------------\n")
 
-    # if the request isn't done, wait continuously
-    print("Waiting for request to complete ...")
-    while (s.completed is False):
-        time.sleep(1)
-        s.update_status()
+    # if the requests aren't done, wait for all of them concurrently
+    print("Waiting for requests to complete ...")
+    loop = asyncio.get_event_loop()
+    loop.run_until_complete(asyncio.gather(*[wait_for_search(s, poll_interval=1.0) for s in searches]))
 
     # print status
-    pprint.pprint(s.status)
+    for s in searches:
+        pprint.pprint(s.status)
 
 
 # ----------
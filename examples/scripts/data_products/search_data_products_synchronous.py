@@ -1,16 +1,70 @@
 import pyaurorax
 import datetime
-import pprint
+import asyncio
+import functools
+import json
+
+# use uvloop for the event loop if it's installed (faster than the default
+# event loop, but it isn't available on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ModuleNotFoundError:
+    pass
+
+# save the data to a parquet file if pyarrow is installed, instead of
+# printing it
+try:
+    import pyarrow
+    import pyarrow.parquet
+    pyarrow_found = True
+except ModuleNotFoundError:
+    pyarrow_found = False
+
+# search window for each day (set once, since they don't change)
+SEARCH_WINDOWS = [(datetime.datetime(2020, 1, day, 0, 0, 0),
+                   datetime.datetime(2020, 1, day, 23, 59, 59)) for day in range(1, 4)]
+
+
+async def do_search(start, end, programs):
+    # run the blocking search without blocking the event loop, so that
+    # several searches can be done at the same time
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, functools.partial(pyaurorax.data_products.search,
+                                                              start,
+                                                              end,
+                                                              programs=programs))
 
 
 def main():
-    # do search
-    s = pyaurorax.data_products.search(datetime.datetime(2020, 1, 1, 0, 0, 0),
-                                       datetime.datetime(2020, 1, 1, 23, 59, 59),
-                                       programs=["auroramax"],
-                                       verbose=True)
-    print()
-    pprint.pprint(s.data)
+    # do searches concurrently
+    print("Searching %d days ..." % (len(SEARCH_WINDOWS)))
+    loop = asyncio.get_event_loop()
+    searches = loop.run_until_complete(asyncio.gather(*[do_search(start, end, ["auroramax"])
+                                                        for start, end in SEARCH_WINDOWS]))
+
+    # save data to a parquet file, building each column in one go (the
+    # metadata keys vary between records, so it is saved as a JSON string)
+    data = [dp for s in searches for dp in s.data]
+    if (pyarrow_found is True):
+        table = pyarrow.table({
+            "program": [dp.data_source.program for dp in data],
+            "platform": [dp.data_source.platform for dp in data],
+            "instrument_type": [dp.data_source.instrument_type for dp in data],
+            "data_product_type": [dp.data_product_type for dp in data],
+            "start": [dp.start for dp in data],
+            "end": [dp.end for dp in data],
+            "url": [dp.url for dp in data],
+            "metadata": [json.dumps(dp.metadata) for dp in data],
+        })
+        pyarrow.parquet.write_table(table, "data_products.parquet", compression="zstd")
+        print("Saved %d records to data_products.parquet" % (len(data)))
+        return
+
+    # otherwise print data, one record per line (instead of pretty-printing
+    # the whole list at once, which builds one very large string for big searches)
+    for dp in data:
+        print(dp.json())
 
 
 # ----------
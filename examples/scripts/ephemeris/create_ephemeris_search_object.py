@@ -1,14 +1,25 @@
 import pyaurorax
 import datetime
 
+# search window for each day (set once, since they don't change)
+SEARCH_WINDOWS = [(datetime.datetime(2020, 1, day, 0, 0, 0),
+                   datetime.datetime(2020, 1, day, 23, 59, 59)) for day in range(1, 10)]
+
 
 def main():
-    s = pyaurorax.ephemeris.Search(datetime.datetime(2020, 1, 1, 0, 0, 0),
-                                   datetime.datetime(2020, 1, 10, 0, 0, 0),
-                                   programs=["swarm"],
-                                   platforms=["swarma"],
-                                   instrument_types=["footprint"])
-    print(s)
+    # create one search object per day, instead of one covering the whole
+    # range (these can all be performed at the same time using
+    # pyaurorax.ephemeris.search_batch(searches))
+    searches = []
+    for start, end in SEARCH_WINDOWS:
+        s = pyaurorax.ephemeris.Search(start,
+                                       end,
+                                       programs=["swarm"],
+                                       platforms=["swarma"],
+                                       instrument_types=["footprint"])
+        searches.append(s)
+    for s in searches:
+        print(s)
 
 
 # ----------
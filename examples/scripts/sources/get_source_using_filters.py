@@ -1,11 +1,35 @@
 import pyaurorax
+import os
+import json
+import time
+import hashlib
+
+# data sources rarely change, so results are re-used for a day
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pyaurorax", "sources")
+CACHE_MAX_AGE = 24 * 60 * 60  # 24 hours
+
+
+def get_using_filters_cached(**filters):
+    # use the cached data sources for these filters if they're recent enough
+    key = hashlib.sha256(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    cache_filename = os.path.join(CACHE_DIR, "%s.json" % (key))
+    if (os.path.exists(cache_filename) and time.time() - os.path.getmtime(cache_filename) < CACHE_MAX_AGE):
+        with open(cache_filename, "r") as fp:
+            return [pyaurorax.sources.DataSource(**ds) for ds in json.load(fp)]
+
+    # otherwise get them from the API and save them for next time
+    sources = pyaurorax.sources.get_using_filters(**filters)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_filename, "w") as fp:
+        json.dump([ds.dict() for ds in sources], fp)
+    return sources
 
 
 def main():
     # get data source
-    ds = pyaurorax.sources.get_using_filters(program="swarm",
-                                             instrument_type="footprint",
-                                             format=pyaurorax.FORMAT_FULL_RECORD)
+    ds = get_using_filters_cached(program="swarm",
+                                  instrument_type="footprint",
+                                  format=pyaurorax.FORMAT_FULL_RECORD)
     print(ds)
 
 
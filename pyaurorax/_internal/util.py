@@ -5,3 +5,12 @@ import datetime
 def json_converter(o):
     if isinstance(o, datetime.datetime):
         return o.__str__()
+
+
+# format a timestamp for a search query (isoformat is implemented in C so
+# it's faster than strftime; the timezone is dropped, same as strftime did).
+# Dates don't have a time to replace, so they still use strftime.
+def format_query_timestamp(dt: datetime.datetime) -> str:
+    if (not isinstance(dt, datetime.datetime)):
+        return dt.strftime("%Y-%m-%dT%H:%M:%S")
+    return dt.replace(microsecond=0, tzinfo=None).isoformat()
@@ -4,8 +4,10 @@ Class definition used for managing an API request
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel
-from typing import Optional, Dict, List, Union
+from typing import Optional, Dict, List, Union, Callable, Any
 from ..._internal.util import json_converter
 from .response import AuroraXResponse
 from ..api import get_api_key
@@ -16,6 +18,14 @@ from ...exceptions import (AuroraXMaxRetriesException,
                            AuroraXUnexpectedEmptyResponse,
                            AuroraXException)
 
+# import orjson if installed (much faster for decoding large responses, ie.
+# the results of a search), otherwise use the standard library
+_json_loads: Callable[..., Any]
+try:
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:
+    _json_loads = json.loads
+
 # pdoc init
 __pdoc__: Dict = {}
 
@@ -32,6 +42,33 @@ REQUEST_HEADERS: Dict = {
 API_KEY_HEADER_NAME: str = "x-aurorax-api-key"
 """ The API key header used when sending requests to the AuroraX API """
 
+POOL_CONNECTIONS: int = 8
+""" Number of connection pools (ie. hosts) kept for re-use when making requests """
+
+POOL_MAXSIZE: int = 16
+""" Max number of connections kept for re-use in each connection pool """
+
+CONNECTION_RETRIES: int = 3
+"""
+Number of retry attempts for idempotent requests (ie. getting a request status)
+that get a 429, 502, 503 or 504 response (requests that fail to connect aren't
+retried, so being offline fails quickly)
+"""
+
+# shared session, so that connections (and their TLS handshakes) are re-used
+# between requests instead of creating a new connection each time
+_session = requests.Session()
+_session.headers.update(REQUEST_HEADERS)
+_adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                       pool_maxsize=POOL_MAXSIZE,
+                       max_retries=Retry(total=CONNECTION_RETRIES,
+                                         connect=0,
+                                         backoff_factor=0.2,
+                                         status_forcelist=[429, 502, 503, 504],
+                                         raise_on_status=False))
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
 
 class AuroraXRequest(BaseModel):
     """
@@ -55,15 +92,9 @@ class AuroraXRequest(BaseModel):
     null_response: Optional[bool] = False
 
     def __merge_headers(self):
-        # set initial headers
-        all_headers = {
-            "accept": "application/json",
-            "Content-Type": "application/json"
-        }
-
-        # add headers passed into the class
-        for key, value in self.headers.items():
-            all_headers[key] = value
+        # add headers passed into the class (the default ones are set
+        # on the shared session)
+        all_headers = dict(self.headers)
 
         # add api key
         api_key = get_api_key()
@@ -99,7 +130,7 @@ class AuroraXRequest(BaseModel):
         body_santized = json.dumps(self.body, default=json_converter)
 
         # make request
-        req = requests.request(self.method,
+        req = _session.request(self.method,
                                self.url,
                                headers=self.__merge_headers(),
                                params=self.params,
@@ -112,7 +143,7 @@ class AuroraXRequest(BaseModel):
                     if (i == (DEFAULT_RETRIES - 1)):
                         raise AuroraXMaxRetriesException("%s (%s)" % (req.content.decode(),
                                                                       req.status_code))
-                    req = requests.request(self.method,
+                    req = _session.request(self.method,
                                            self.url,
                                            headers=self.__merge_headers(),
                                            params=self.params,
@@ -124,10 +155,11 @@ class AuroraXRequest(BaseModel):
         # check if authorization worked (raised by API or by Nginx)
         if (req.status_code == 401):
             if (req.headers["Content-Type"] == "application/json"):
-                if ("error_message" in req.json()):
+                error_json = req.json()
+                if ("error_message" in error_json):
                     # this will be an error message that the API meant to send
                     raise AuroraXUnauthorizedException("%s %s" % (req.status_code,
-                                                                  req.json()["error_message"]))
+                                                                  error_json["error_message"]))
                 else:
                     raise AuroraXUnauthorizedException("Error 401: unauthorized")
             else:
@@ -136,18 +168,20 @@ class AuroraXRequest(BaseModel):
         # check for 404 error (raised by API or by Nginx)
         if (req.status_code == 404):
             if (req.headers["Content-Type"] == "application/json"):
-                if ("error_message" in req.json()):
+                error_json = req.json()
+                if ("error_message" in error_json):
                     # this will be an error message that the API meant to send
                     raise AuroraXNotFoundException("%s %s" % (req.status_code,
-                                                              req.json()["error_message"]))
+                                                              error_json["error_message"]))
                 else:
                     # this will likely be a 404 from the java servlet
                     raise AuroraXNotFoundException("Error 404: not found")
             else:
                 raise AuroraXNotFoundException("Error 404: not found")
 
-        # check if we only want to do limited evaluation
-        if (limited_evaluation is True):
+        # check if we only want to do limited evaluation, or the resource
+        # hasn't changed since it was last retrieved (conditional requests)
+        if (limited_evaluation is True or req.status_code == 304):
             res = AuroraXResponse(request=req,
                                   data=None,
                                   status_code=req.status_code)
@@ -159,7 +193,7 @@ class AuroraXRequest(BaseModel):
                 if (len(req.content) == 0):
                     raise AuroraXUnexpectedEmptyResponse("No response received")
                 else:
-                    response_data = req.json()
+                    response_data = _json_loads(req.content)
             else:
                 raise AuroraXUnexpectedContentTypeException("%s (%s)" % (req.content.decode(),
                                                                          req.status_code))
@@ -169,14 +203,13 @@ class AuroraXRequest(BaseModel):
             else:
                 response_data = req.json()
 
-        # check for server error
+        # check for server error (the response was already decoded above)
         if (req.status_code == 500):
-            response_json = req.json()
-            if ("error_message" in response_json):
-                raise AuroraXException("%s (%s)" % (response_json["error_message"],
+            if ("error_message" in response_data):
+                raise AuroraXException("%s (%s)" % (response_data["error_message"],
                                                     req.status_code))
             else:
-                raise AuroraXException(response_json)
+                raise AuroraXException(response_data)
 
         # create reponse object
         res = AuroraXResponse(request=req,
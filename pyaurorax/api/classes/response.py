@@ -3,14 +3,14 @@ Class definition used for managing the response from an
 API request
 """
 
-from pydantic import BaseModel
+import pprint
 from typing import Dict, Any
 
 # pdoc init
 __pdoc__: Dict = {}
 
 
-class AuroraXResponse(BaseModel):
+class AuroraXResponse():
     """
     AuroraX API response class
 
@@ -19,9 +19,14 @@ class AuroraXResponse(BaseModel):
         data: the data received as part of the request
         status_code: the HTTP status code received when making the request
     """
-    request: Any
-    data: Any
-    status_code: int
+    # one of these is created for every API request, so we use slots
+    # and skip any validation of the (untyped) fields
+    __slots__ = ("request", "data", "status_code")
+
+    def __init__(self, request: Any, data: Any, status_code: int) -> None:
+        self.request = request
+        self.data = data
+        self.status_code = status_code
 
     def __str__(self) -> str:
         """
@@ -39,4 +44,18 @@ class AuroraXResponse(BaseModel):
         Returns:
             object representation of AuroraXResponse
         """
-        return f"AuroraXResponse [{self.status_code}]"
+        # summarize the data instead of printing it, since it can be
+        # very large (ie. results of a search)
+        data_type = type(self.data).__name__
+        data_len = len(self.data) if hasattr(self.data, "__len__") else "?"
+        return f"AuroraXResponse(status_code={self.status_code}, data=<{data_type} len={data_len}>)"
+
+    def full_repr(self) -> str:
+        """
+        Object representation, including all the data
+
+        Returns:
+            object representation of AuroraXResponse, with the data
+            pretty-printed (can be very large)
+        """
+        return f"AuroraXResponse(status_code={self.status_code}, data={pprint.pformat(self.data)})"
@@ -61,10 +61,9 @@ def ephemeris(start: datetime.date,
                          params=params)
     res = req.execute()
 
-    # cast data source record
-    for i in range(0, len(res.data)):
-        ds = DataSource(**res.data[i]["data_source"], format=format)
-        res.data[i]["data_source"] = ds
+    # cast data source records
+    for av in res.data:
+        av["data_source"] = DataSource(**av["data_source"], format=format)
 
     # return
     return [AvailabilityResult(**av) for av in res.data]
@@ -119,10 +118,9 @@ def data_products(start: datetime.date,
                          params=params)
     res = req.execute()
 
-    # cast data source record
-    for i in range(0, len(res.data)):
-        ds = DataSource(**res.data[i]["data_source"], format=format)
-        res.data[i]["data_source"] = ds
+    # cast data source records
+    for av in res.data:
+        av["data_source"] = DataSource(**av["data_source"], format=format)
 
     # return
     return [AvailabilityResult(**av) for av in res.data]
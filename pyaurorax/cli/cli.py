@@ -1,16 +1,41 @@
+import importlib
 import requests
 import click
 import pyaurorax
-from .availability import commands as availability_commands
-from .conjunctions import commands as conjunctions_commands
-from .data_products import commands as data_products_commands
-from .ephemeris import commands as ephemeris_commands
-from .sources import commands as sources_commands
-from .util import commands as util_commands
 
 # default context settings
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
+# sub command groups, and where they are defined (they are only imported
+# when used, so that running one command doesn't load all the others)
+SUBCOMMAND_GROUPS = {
+    "availability": "pyaurorax.cli.availability.commands.availability_group",
+    "conjunctions": "pyaurorax.cli.conjunctions.commands.conjunctions_group",
+    "data_products": "pyaurorax.cli.data_products.commands.data_products_group",
+    "ephemeris": "pyaurorax.cli.ephemeris.commands.ephemeris_group",
+    "sources": "pyaurorax.cli.sources.commands.sources_group",
+    "util": "pyaurorax.cli.util.commands.utility_group",
+}
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports its sub commands only when they are needed
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = {} if lazy_subcommands is None else lazy_subcommands
+
+    def list_commands(self, ctx):
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands.keys()))
+
+    def get_command(self, ctx, cmd_name):
+        if (cmd_name in self.lazy_subcommands):
+            module_name, attr_name = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+            return getattr(importlib.import_module(module_name), attr_name)
+        return super().get_command(ctx, cmd_name)
+
 
 class Config(object):
     def __init__(self, verbose=False, api_key=None):
@@ -29,7 +54,7 @@ def __test_connectivity(quiet=False, return_json=False):
         click.echo("Error connecting to AuroraX API, got a %d response" % (r.status_code))
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_subcommands=SUBCOMMAND_GROUPS, invoke_without_command=True)
 @click.version_option(version="0.9.0")
 @click.option("--api-key", type=str, help="Specify an API key")
 @click.option("--api-base-url", type=str, help="Set the AuroraX API base URL")
@@ -73,12 +98,3 @@ To learn more about usage, type:
     else:
         # subcommand was called, move on to that
         pass
-
-
-# add sub commands
-cli.add_command(availability_commands.availability_group)
-cli.add_command(conjunctions_commands.conjunctions_group)
-cli.add_command(data_products_commands.data_products_group)
-cli.add_command(ephemeris_commands.ephemeris_group)
-cli.add_command(sources_commands.sources_group)
-cli.add_command(util_commands.utility_group)
@@ -1,35 +1,63 @@
 import sys
 import click
 import pprint
-import json
 import os
-import datetime
 import pyaurorax
-from dateutil.parser import parse
-from ..helpers import (print_request_logs_table,
+from ..helpers import (LOG_LEVEL_CHOICE,
+                       TERMINAL_OUTPUT_CHOICE,
+                       print_request_logs_table,
                        print_request_status,
-                       get_search_data)
-from ..templates import CONJUNCTION_SEARCH_TEMPLATE
+                       fetch_request_status,
+                       fetch_request_statuses,
+                       get_search_data,
+                       echo_progress,
+                       load_json,
+                       render_search_template,
+                       parse_timestamp)
+
+# globals
+DEFAULT_MAX_CONJUNCTION_SEARCH_DAYS = "366"
+
+
+def __check_search_date_range(start, end):
+    # get the max search length (read here instead of at import time, so
+    # that an invalid value only affects commands that use it)
+    max_days = os.getenv("PYAURORAX_MAX_SEARCH_DAYS", DEFAULT_MAX_CONJUNCTION_SEARCH_DAYS) or DEFAULT_MAX_CONJUNCTION_SEARCH_DAYS
+    try:
+        max_days = int(max_days)
+    except ValueError:
+        click.echo("Error: invalid PYAURORAX_MAX_SEARCH_DAYS environment variable value "
+                   "'%s', it must be a whole number of days" % (max_days))
+        sys.exit(1)
+
+    # reject overly large searches before they're sent to the API
+    if ((end - start).days > max_days):
+        click.echo("Error: search date range is longer than %d days, please reduce it "
+                   "(the limit can be changed using the PYAURORAX_MAX_SEARCH_DAYS "
+                   "environment variable)" % (max_days))
+        sys.exit(1)
+
+
+def __query_to_search_kwargs(q):
+    # convert a query (ie. from a file or a previous request) into the
+    # arguments used to create a search
+    start = parse_timestamp(q["start"])
+    end = parse_timestamp(q["end"])
+    __check_search_date_range(start, end)
+    return {
+        "start": start,
+        "end": end,
+        "distance": q["max_distances"],
+        "ground": q.get("ground"),
+        "space": q.get("space"),
+        "events": q.get("events"),
+        "conjunction_types": q.get("conjunction_types"),
+        "epoch_search_precision": q.get("epoch_search_precision"),
+    }
 
 
 def __create_search_object_from_query(q):
-    start = parse(q["start"], ignoretz=True)
-    end = parse(q["end"], ignoretz=True)
-    max_distances = q["max_distances"]
-    ground = None if "ground" not in q else q["ground"]
-    space = None if "space" not in q else q["space"]
-    events = None if "events" not in q else q["events"]
-    conjunction_types = None if "conjunction_types" not in q else q["conjunction_types"]
-    epoch_search_precision = None if "epoch_search_precision" not in q else q["epoch_search_precision"]
-    s = pyaurorax.conjunctions.Search(start,
-                                      end,
-                                      distance=max_distances,
-                                      ground=ground,
-                                      space=space,
-                                      events=events,
-                                      conjunction_types=conjunction_types,
-                                      epoch_search_precision=epoch_search_precision)
-    return s
+    return pyaurorax.conjunctions.Search(**__query_to_search_kwargs(q))
 
 
 @click.group("conjunctions", help="Interact with conjunction searches")
@@ -38,49 +66,44 @@ def conjunctions_group():
 
 
 @conjunctions_group.command("get_status",
-                            short_help="Get status info for a conjunction search request")
-@click.argument("request_uuid", type=str)
+                            short_help="Get status info for conjunction search requests")
+@click.argument("request_uuids", type=str, nargs=-1, required=True)
 @click.option("--show-logs", "show_logs", is_flag=True,
               help="Show the logs for the request")
 @click.option("--show-query", "show_query", is_flag=True,
               help="Show the query for the request")
 @click.option("--filter-logs",
-              type=click.Choice(["debug", "info", "warn", "error"]),
+              type=LOG_LEVEL_CHOICE,
               help="Filter log messages (used with --show-logs)")
 @click.option("--table-max-width", "--max-width", type=int,
               help="Max width for the logs table")
 @click.pass_obj
-def get_status(config, request_uuid, show_logs, show_query, filter_logs, table_max_width):
+def get_status(config, request_uuids, show_logs, show_query, filter_logs, table_max_width):
     """
-    Get information for a conjunction search request
+    Get information for one or more conjunction search requests
 
     \b
-    REQUEST_UUID    the request unique identifier
+    REQUEST_UUIDS   the request unique identifiers
     """
-    # get request status
-    try:
-        url = pyaurorax.api.urls.conjunction_request_url.format(request_uuid)
-        s = pyaurorax.requests.get_status(url)
-    except pyaurorax.AuroraXNotFoundException as e:
-        click.echo("%s occurred: request ID not found" % (type(e).__name__))
-        sys.exit(1)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    # get request statuses
+    statuses = fetch_request_statuses("conjunctions", request_uuids)
 
-    # print status nicely
-    print_request_status(s,
-                         show_logs=show_logs,
-                         show_query=show_query,
-                         filter_logs=filter_logs,
-                         table_max_width=table_max_width)
+    # print statuses nicely
+    for i in range(0, len(request_uuids)):
+        if (len(request_uuids) > 1):
+            click.echo("%sRequest ID:\t\t%s" % ("" if i == 0 else "\n", request_uuids[i]))
+        print_request_status(statuses[i],
+                             show_logs=show_logs,
+                             show_query=show_query,
+                             filter_logs=filter_logs,
+                             table_max_width=table_max_width)
 
 
 @conjunctions_group.command("get_logs",
                             short_help="Get logs for a conjunction search request")
 @click.argument("request_uuid", type=str)
 @click.option("--filter", "--filter-logs", "filter_",
-              type=click.Choice(["debug", "info", "warn", "error"]),
+              type=LOG_LEVEL_CHOICE,
               help="Filter log messages")
 @click.option("--table-max-width", "--max-width", type=int,
               help="Max width for the logs table")
@@ -93,15 +116,7 @@ def get_logs(config, request_uuid, filter_, table_max_width):
     REQUEST_UUID    the request unique identifier
     """
     # get request status
-    try:
-        url = pyaurorax.api.urls.conjunction_request_url.format(request_uuid)
-        s = pyaurorax.requests.get_status(url)
-    except pyaurorax.AuroraXNotFoundException as e:
-        click.echo("%s occurred: request ID not found" % (type(e).__name__))
-        sys.exit(1)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    s = fetch_request_status("conjunctions", request_uuid)
 
     # print out the logs nicely
     if ("logs" in s):
@@ -124,20 +139,11 @@ def get_query(config, request_uuid):
     REQUEST_UUID    the request unique identifier
     """
     # get request status
-    try:
-        url = pyaurorax.api.urls.conjunction_request_url.format(request_uuid)
-        s = pyaurorax.requests.get_status(url)
-    except pyaurorax.AuroraXNotFoundException as e:
-        click.echo("%s occurred: request ID not found" % (type(e).__name__))
-        sys.exit(1)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    s = fetch_request_status("conjunctions", request_uuid)
 
     # print out query
     if ("query" in s["search_request"]):
-        query_to_show = s["search_request"]["query"]
-        del query_to_show["request_id"]
+        query_to_show = {k: v for k, v in s["search_request"]["query"].items() if k != "request_id"}
         click.echo(pprint.pformat(query_to_show))
     else:
         click.echo("\nSearch query missing from request status, unable to display")
@@ -147,7 +153,7 @@ def get_query(config, request_uuid):
                             short_help="Get data for a conjunction search request")
 @click.argument("request_uuid", type=str)
 @click.option("--outfile", type=str, help="output file to save data to (a .json file)")
-@click.option("--output-to-terminal", type=click.Choice(["dict", "objects"]),
+@click.option("--output-to-terminal", type=TERMINAL_OUTPUT_CHOICE,
               help="output data to terminal in a certain format (instead of to file)")
 @click.option("--indent", type=int, default=2, show_default=True,
               help="indentation when saving data to file")
@@ -171,8 +177,21 @@ def get_data(config, request_uuid, outfile, output_to_terminal, indent, minify):
 @conjunctions_group.command("search_resubmit",
                             short_help="Resubmit a conjunction search request")
 @click.argument("request_uuid", type=str)
+@click.option("--wait", is_flag=True,
+              help="Wait for the new search to complete and get its data")
+@click.option("--poll-interval",
+              default=pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME,
+              show_default=True,
+              help="max polling interval when waiting for data (seconds, used with --wait)")
+@click.option("--outfile", type=str, help="output file to save data to (a .json file, used with --wait)")
+@click.option("--output-to-terminal", type=TERMINAL_OUTPUT_CHOICE,
+              help="output data to terminal in a certain format (instead of to file, used with --wait)")
+@click.option("--indent", type=int, default=2, show_default=True,
+              help="indentation when saving data to file (used with --wait)")
+@click.option("--minify", is_flag=True, help="Minify the JSON data saved to file (used with --wait)")
 @click.pass_obj
-def search_resubmit(config, request_uuid):
+def search_resubmit(config, request_uuid, wait, poll_interval, outfile,
+                    output_to_terminal, indent, minify):
     """
     Resubmit a conjunction search request
 
@@ -180,16 +199,8 @@ def search_resubmit(config, request_uuid):
     REQUEST_UUID    the request unique identifier
     """
     # get request status
-    try:
-        click.echo("Retrieving query for request '%s' ..." % (request_uuid))
-        url = pyaurorax.api.urls.conjunction_request_url.format(request_uuid)
-        status = pyaurorax.requests.get_status(url)
-    except pyaurorax.AuroraXNotFoundException as e:
-        click.echo("%s occurred: request ID not found" % (type(e).__name__))
-        sys.exit(1)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    click.echo("Retrieving query for request '%s' ..." % (request_uuid))
+    status = fetch_request_status("conjunctions", request_uuid)
 
     # set the query to use for resubmission
     if ("query" not in status["search_request"]):
@@ -208,34 +219,49 @@ def search_resubmit(config, request_uuid):
     # output new request ID
     click.echo("Request has been resubmitted, new request ID is %s" % (s.request_id))
 
+    # wait for the new search and get its data, re-using the search object
+    if (wait is True):
+        s.wait(poll_interval=poll_interval, verbose=True)
+        get_search_data("conjunctions",
+                        s.request_id,
+                        outfile,
+                        output_to_terminal,
+                        indent,
+                        minify,
+                        show_times=True,
+                        search_obj=s)
+
 
 @conjunctions_group.command("search_template",
                             short_help="Output template for a conjunction search request")
 @click.option("--outfile", type=str, help="save template to a file")
 @click.option("--indent", type=int, default=2, show_default=True,
               help="indentation to use when outputing template")
+@click.option("--minify", is_flag=True, help="Minify the template")
 @click.pass_obj
-def search_template(config, outfile, indent):
+def search_template(config, outfile, indent, minify):
     """
     Output template for a conjunction search request
     """
+    # write the template to the file or stdout in one go
+    data = render_search_template("conjunctions", indent=indent, minify=minify)
     if (outfile is not None):
-        with open(outfile, 'w', encoding="utf-8") as fp:
-            json.dump(CONJUNCTION_SEARCH_TEMPLATE, fp, indent=indent)
+        with open(outfile, "wb") as fp:
+            fp.write(data)
         click.echo("Saved template to %s" % (outfile))
     else:
-        click.echo(json.dumps(CONJUNCTION_SEARCH_TEMPLATE, indent=indent))
+        click.echo(data)
 
 
 @conjunctions_group.command("search",
                             short_help="Perform a conjunction search request")
-@click.argument("infile", type=str)
+@click.argument("infile", type=click.File("rb"))
 @click.option("--poll-interval",
               default=pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME,
               show_default=True,
-              help="polling interval when waiting for data (seconds)")
+              help="max polling interval when waiting for data (seconds)")
 @click.option("--outfile", type=str, help="output file to save data to (a .json file)")
-@click.option("--output-to-terminal", type=click.Choice(["dict", "objects"]),
+@click.option("--output-to-terminal", type=TERMINAL_OUTPUT_CHOICE,
               help="output data to terminal in a certain format (instead of to file)")
 @click.option("--indent", type=int, default=2, show_default=True,
               help="indentation when saving data to file")
@@ -249,39 +275,17 @@ def search(config, infile, poll_interval, outfile, output_to_terminal, indent, m
     \b
     INFILE      input file with query (must be a JSON)
     """
-    # check that infile exists
-    if not (os.path.exists(infile)):
-        click.echo("Error: infile doesn't exist (%s" % (infile))
-        sys.exit(1)
-
     # read in infile
-    if (quiet is False):
-        click.echo("[%s] Reading in query file ..." % (datetime.datetime.now()))
-    with open(infile, 'r', encoding="utf-8") as fp:
-        q = json.load(fp)
+    echo_progress("Reading in query file ...", quiet=quiet)
+    q = load_json(infile)
 
     # set search params
-    if (quiet is False):
-        click.echo("[%s] Preparing search ..." % (datetime.datetime.now()))
-    start = parse(q["start"], ignoretz=True)
-    end = parse(q["end"], ignoretz=True)
-    max_distances = q["max_distances"]
-    ground = None if "ground" not in q else q["ground"]
-    space = None if "space" not in q else q["space"]
-    events = None if "events" not in q else q["events"]
-    conjunction_types = None if "conjunction_types" not in q else q["conjunction_types"]
-    epoch_search_precision = None if "epoch_search_precision" not in q else q["epoch_search_precision"]
+    echo_progress("Preparing search ...", quiet=quiet)
+    search_kwargs = __query_to_search_kwargs(q)
     verbose_search = True if quiet is False else False  # pylint: disable=simplifiable-if-expression
 
     # start search
-    s = pyaurorax.conjunctions.search(start,
-                                      end,
-                                      distance=max_distances,
-                                      ground=ground,
-                                      space=space,
-                                      events=events,
-                                      conjunction_types=conjunction_types,
-                                      epoch_search_precision=epoch_search_precision,
+    s = pyaurorax.conjunctions.search(**search_kwargs,
                                       poll_interval=poll_interval,
                                       verbose=verbose_search,
                                       return_immediately=True)
@@ -297,12 +301,13 @@ def search(config, infile, poll_interval, outfile, output_to_terminal, indent, m
                     indent,
                     minify,
                     show_times=True,
-                    search_obj=s)
+                    search_obj=s,
+                    quiet=quiet)
 
 
 @conjunctions_group.command("describe",
                             short_help="Describe a conjunction search request")
-@click.argument("infile", type=str)
+@click.argument("infile", type=click.File("rb"))
 @click.pass_obj
 def describe(config, infile):
     """
@@ -312,14 +317,8 @@ def describe(config, infile):
     \b
     INFILE      input file with query (must be a JSON)
     """
-    # check that infile exists
-    if not (os.path.exists(infile)):
-        click.echo("Error: infile doesn't exist (%s" % (infile))
-        sys.exit(1)
-
     # read in infile
-    with open(infile, 'r', encoding="utf-8") as fp:
-        q = json.load(fp)
+    q = load_json(infile)
 
     # create search object
     s = __create_search_object_from_query(q)
@@ -3,23 +3,194 @@ import os
 import click
 import pprint
 import datetime
-import humanize
 import textwrap
 import warnings
 import json
+import functools
 import pyaurorax
-from dateutil.parser import parse
-from termcolor import colored
-from texttable import Texttable
+from .templates import SEARCH_TEMPLATES
 
+# import orjson if installed (much faster for large JSON data)
+try:
+    import orjson
+    __orjson_found = True
+except ModuleNotFoundError:
+    __orjson_found = False
 
-def __echo_helper(message, show_times=False):
-    if (show_times is True):
-        click.echo("[%s] %s" % (datetime.datetime.now(), message))
+# NOTE: the third-party modules used for formatting output (humanize,
+# dateutil, termcolor, texttable) are imported inside the functions that
+# use them, so that they're only loaded when a command actually needs them
+# and the CLI startup (ie. --help) stays fast
+
+# log levels of a request's log messages
+LOG_LEVELS = ("debug", "info", "warn", "error")
+LOG_LEVEL_CHOICE = click.Choice(LOG_LEVELS)
+
+# formats that search data can be output to the terminal in
+TERMINAL_OUTPUT_FORMATS = ("dict", "objects")
+TERMINAL_OUTPUT_CHOICE = click.Choice(TERMINAL_OUTPUT_FORMATS)
+
+# max number of parsed timestamps to cache
+PARSED_TIMESTAMP_CACHE_MAX_SIZE = 128
+
+# max number of rendered search templates to cache
+RENDERED_TEMPLATE_CACHE_MAX_SIZE = 8
+
+
+def load_json(fp):
+    """
+    Function to read JSON data from a file object (opened in text or
+    binary mode), using orjson if it is installed
+    """
+    if (__orjson_found is True):
+        return orjson.loads(fp.read())
+    return json.load(fp)
+
+
+def dump_json(obj, fp, indent=None, minify=False):
+    """
+    Function to write JSON data to a file object, using orjson
+    if it is installed
+
+    orjson only supports an indentation of 2, so any other indentation
+    is written using the json module instead.
+    """
+    if (__orjson_found is True and (minify is True or indent == 2)):
+        if (hasattr(fp, "buffer")):
+            # write the bytes straight to the underlying binary file, instead
+            # of decoding them into another (possibly very large) string
+            fp.flush()
+            fp.buffer.write(dumps_json(obj, indent=indent, minify=minify))
+        else:
+            fp.write(dumps_json(obj, indent=indent, minify=minify).decode())
+    elif (minify is True):
+        json.dump(obj, fp, separators=(",", ":"))
+    else:
+        json.dump(obj, fp, indent=indent)
+
+
+def dumps_json(obj, indent=None, minify=False):
+    """
+    Function to serialize JSON data into a single bytes object, using
+    orjson if it is installed
+    """
+    if (__orjson_found is True and (minify is True or indent == 2)):
+        return orjson.dumps(obj, option=0 if minify is True else orjson.OPT_INDENT_2)
+    elif (minify is True):
+        return json.dumps(obj, separators=(",", ":")).encode()
     else:
+        return json.dumps(obj, indent=indent).encode()
+
+
+@functools.lru_cache(maxsize=RENDERED_TEMPLATE_CACHE_MAX_SIZE)
+def render_search_template(request_type, indent=None, minify=False):
+    """
+    Function to get the serialized template for a type of search
+    request (the templates never change, so they are only serialized
+    once for each indentation)
+    """
+    return dumps_json(SEARCH_TEMPLATES[request_type], indent=indent, minify=minify)
+
+
+@functools.lru_cache(maxsize=PARSED_TIMESTAMP_CACHE_MAX_SIZE)
+def parse_timestamp(value):
+    """
+    Function to parse a timestamp string into a datetime object (without
+    timezone info), using datetime.fromisoformat() for ISO format strings
+    since it is much faster than dateutil. Results are cached since the same
+    timestamps are often parsed more than once.
+    """
+    # the timezone is dropped anyway, and older versions of fromisoformat()
+    # don't support the 'Z' suffix
+    if (value.endswith("Z")):
+        value = value[:-1]
+
+    # parse
+    try:
+        return datetime.datetime.fromisoformat(value).replace(tzinfo=None)
+    except (AttributeError, ValueError):
+        # not an ISO format string (or Python 3.6, which doesn't have
+        # fromisoformat), use dateutil instead
+        from dateutil.parser import parse
+        return parse(value, ignoretz=True)
+
+
+def get_search_kwargs_from_query(q, metadata_filters_key):
+    """
+    Function to convert a data product or ephemeris search query (ie. from
+    a file or a previous request) into the arguments used to create a search
+    """
+    data_sources = q.get("data_sources", {})
+    metadata_filters = data_sources.get(metadata_filters_key) or {}
+    return {
+        "start": parse_timestamp(q["start"]),
+        "end": parse_timestamp(q["end"]),
+        "programs": data_sources.get("programs"),
+        "platforms": data_sources.get("platforms"),
+        "instrument_types": data_sources.get("instrument_types"),
+        "metadata_filters": metadata_filters.get("expressions"),
+        "metadata_filters_logical_operator": metadata_filters.get("logical_operator"),
+    }
+
+
+def echo_progress(message, quiet=False):
+    """
+    Function to print a progress message prefixed with the current
+    time, unless quiet output was asked for
+    """
+    if (quiet is False):
+        click.echo("[%s] %s" % (datetime.datetime.now(), message))
+
+
+def __echo_helper(message, show_times=False, quiet=False):
+    if (show_times is True):
+        echo_progress(message, quiet=quiet)
+    elif (quiet is False):
         click.echo(message)
 
 
+def get_request_url(request_type, request_uuid):
+    """
+    Function to get the URL of a search request
+    """
+    if (request_type == "conjunctions"):
+        return pyaurorax.api.urls.conjunction_request_url.format(request_uuid)
+    elif (request_type == "data_products"):
+        return pyaurorax.api.urls.data_products_request_url.format(request_uuid)
+    elif (request_type == "ephemeris"):
+        return pyaurorax.api.urls.ephemeris_request_url.format(request_uuid)
+    else:
+        click.echo("Unexpected error occurred, please open an issue on "
+                   "the Github repository detailing how you were able "
+                   "to make this message appear")
+        sys.exit(1)
+
+
+def fetch_request_status(request_type, request_uuid):
+    """
+    Function to get the status of a search request, exiting with an
+    error message if it couldn't be retrieved
+    """
+    return fetch_request_statuses(request_type, [request_uuid])[0]
+
+
+def fetch_request_statuses(request_type, request_uuids):
+    """
+    Function to get the status of several search requests at the
+    same time, exiting with an error message if any of them couldn't
+    be retrieved
+    """
+    try:
+        urls = [get_request_url(request_type, request_uuid) for request_uuid in request_uuids]
+        return pyaurorax.requests.get_status_batch(urls)
+    except pyaurorax.AuroraXNotFoundException as e:
+        click.echo("%s occurred: request ID not found" % (type(e).__name__))
+        sys.exit(1)
+    except pyaurorax.AuroraXException as e:
+        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
+        sys.exit(1)
+
+
 def print_request_logs_table(logs, filter_level=None, table_max_width=None):
     """
     Function to print request logs table
@@ -27,6 +198,8 @@ def print_request_logs_table(logs, filter_level=None, table_max_width=None):
     This is a shared helper function because it is used by the
     conjunction, data products, and ephemeris command modules.
     """
+    from texttable import Texttable
+
     # init
     default_wrap_threshold = 70
     if (table_max_width is None):
@@ -46,15 +219,18 @@ def print_request_logs_table(logs, filter_level=None, table_max_width=None):
                           "table width which might not look good")
             wrap_threshold = default_wrap_threshold
 
+    # filter the logs
+    if (filter_level is not None):
+        logs = [log for log in logs if log["level"] == filter_level]
+
     # set table lists
     table_levels = []
     table_summaries = []
     table_timestamps = []
     for log in logs:
-        if (filter_level is None or log["level"] == filter_level):
-            table_levels.append(log["level"])
-            table_summaries.append('\n'.join(textwrap.wrap(log["summary"], wrap_threshold)))
-            table_timestamps.append(parse(log["timestamp"], ignoretz=True))
+        table_levels.append(log["level"])
+        table_summaries.append('\n'.join(textwrap.wrap(log["summary"], wrap_threshold)))
+        table_timestamps.append(parse_timestamp(log["timestamp"]))
     # set header values
     table_headers = ["Timestamp", "Level", "Summary"]
 
@@ -80,10 +256,13 @@ def print_request_status(s, show_logs=False, show_query=False,
     This is a shared helper function because it is used by the
     conjunction, data products, and ephemeris command modules.
     """
+    import humanize
+    from termcolor import colored
+
     # set formatted output variables
     request_completed = colored("False", "yellow")
     request_completed_timestamp = "-"
-    request_started_timestamp = parse(s["search_request"]["requested"], ignoretz=True)
+    request_started_timestamp = parse_timestamp(s["search_request"]["requested"])
     error_condition = "-"
     query_duration = "-"
     data_url = "-"
@@ -92,7 +271,7 @@ def print_request_status(s, show_logs=False, show_query=False,
     if (s["search_result"]["completed_timestamp"] is not None):
         # set completed and completed timestamp
         request_completed = "True"
-        request_completed_timestamp = parse(s["search_result"]["completed_timestamp"], ignoretz=True)
+        request_completed_timestamp = parse_timestamp(s["search_result"]["completed_timestamp"])
 
         # humanize some values
         query_duration = "%s (%.0fms)" % (humanize.precisedelta(
@@ -131,54 +310,42 @@ def print_request_status(s, show_logs=False, show_query=False,
     if (show_query is True):
         if ("query" in s["search_request"]):
             click.echo("\nSearch query:\n==================")
-            query_to_show = s["search_request"]["query"]
-            del query_to_show["request_id"]
+            query_to_show = {k: v for k, v in s["search_request"]["query"].items() if k != "request_id"}
             click.echo(pprint.pformat(query_to_show))
         else:
             click.echo("\nSearch query: missing, unable to display")
 
 
-def get_search_data(type, request_uuid, outfile, output_to_terminal,
-                    indent, minify, show_times=False, search_obj=None):
+def get_search_data(request_type, request_uuid, outfile, output_to_terminal,
+                    indent, minify, show_times=False, search_obj=None, quiet=False):
     """
-    Function to get search request data
+    Function to get search request data (progress messages are not
+    shown if quiet is True, only errors and the final result)
 
     This is a shared helper function because it is used by the
     conjunction, data products, and ephemeris command modules.
     Some if statements are used to differentiate between the
     commans.
     """
+    import humanize
+
     # get the data
     try:
         # check the status if we need to
         if (search_obj is None):
             # set status url
-            __echo_helper("Checking request status ...", show_times=show_times)
-            if (type == "conjunctions"):
-                url = pyaurorax.api.urls.conjunction_request_url.format(request_uuid)
-            elif (type == "data_products"):
-                url = pyaurorax.api.urls.data_products_request_url.format(request_uuid)
-            elif (type == "ephemeris"):
-                url = pyaurorax.api.urls.ephemeris_request_url.format(request_uuid)
-            else:
-                click.echo("Unexpected error occurred, please open an issue on "
-                           "the Github repository detailing how you were able "
-                           "to make this message appear")
-                sys.exit(1)
+            __echo_helper("Checking request status ...", show_times=show_times, quiet=quiet)
+            url = get_request_url(request_type, request_uuid)
 
             # get status
-            try:
-                s = pyaurorax.requests.get_status(url)
-            except pyaurorax.AuroraXNotFoundException:
-                click.echo("Error: request ID not found")
-                sys.exit(1)
+            s = fetch_request_status(request_type, request_uuid)
 
             # check status
             if (s["search_result"]["completed_timestamp"] is None):
                 click.echo("Error: Search is not done yet, not retrieving data")
                 click.echo("\nNote: you can use the get_status command to "
                            "check if the search has completed. Try the command "
-                           "\"aurorax-cli %s get_status %s\"" % (type, request_uuid))
+                           "\"aurorax-cli %s get_status %s\"" % (request_type, request_uuid))
                 sys.exit(1)
 
             # set data url
@@ -191,7 +358,8 @@ def get_search_data(type, request_uuid, outfile, output_to_terminal,
         try:
             __echo_helper("Downloading %s results and %s of data ..." % (humanize.intcomma(s["search_result"]["result_count"]),
                                                                          humanize.naturalsize(s["search_result"]["file_size"])),
-                          show_times=show_times)
+                          show_times=show_times,
+                          quiet=quiet)
             data = pyaurorax.requests.get_data(data_url, skip_serializing=True)
         except pyaurorax.AuroraXDataRetrievalError as e:
             # parse error message
@@ -199,7 +367,7 @@ def get_search_data(type, request_uuid, outfile, output_to_terminal,
                 click.echo("\n%s" % ('\n'.join(textwrap.wrap("Error downloading data: this request is too old and the data "
                                                              "file has been removed on the server. You can re-run the "
                                                              "search using the command \"aurorax-cli %s "
-                                                             "search_resubmit %s\"." % (type, request_uuid), 110))))
+                                                             "search_resubmit %s\"." % (request_type, request_uuid), 110))))
             else:
                 __echo_helper("Error downloading data: %s" % (str(e)), show_times=show_times)
             sys.exit(1)
@@ -210,13 +378,11 @@ def get_search_data(type, request_uuid, outfile, output_to_terminal,
         __echo_helper("%s occurred: %s" % (type(e).__name__, e.args[0]), show_times=show_times)
         sys.exit(1)
 
-    # order data
-    if (type == "conjunctions"):
-        data = sorted(data, key=lambda x: x["start"])
-    elif (type == "data_products"):
-        data = sorted(data, key=lambda x: x["start"])
-    elif (type == "ephemeris"):
-        data = sorted(data, key=lambda x: x["epoch"])
+    # order data (in place, to avoid copying large results)
+    if (request_type == "conjunctions" or request_type == "data_products"):
+        data.sort(key=lambda x: x["start"])
+    elif (request_type == "ephemeris"):
+        data.sort(key=lambda x: x["epoch"])
 
     # save data to file, or print out
     if (output_to_terminal is not None):
@@ -230,13 +396,13 @@ def get_search_data(type, request_uuid, outfile, output_to_terminal,
         else:
             # serialize the data and print
             for d in data:
-                if (type == "conjunctions"):
+                if (request_type == "conjunctions"):
                     # serialize into Conjunction object
                     d_serialized = pyaurorax.conjunctions.Conjunction(**d, format=pyaurorax.FORMAT_BASIC_INFO)
-                elif (type == "data_products"):
+                elif (request_type == "data_products"):
                     # serialize into DataProduct object
                     d_serialized = pyaurorax.data_products.DataProduct(**d, format=pyaurorax.FORMAT_BASIC_INFO)
-                elif (type == "ephemeris"):
+                elif (request_type == "ephemeris"):
                     # serialize into Ephemeris object
                     d_serialized = pyaurorax.ephemeris.Ephemeris(**d, format=pyaurorax.FORMAT_BASIC_INFO)
                 else:
@@ -255,10 +421,7 @@ def get_search_data(type, request_uuid, outfile, output_to_terminal,
             outfile = "%s_data.json" % (request_uuid)
 
         # write data to the file
-        __echo_helper("Writing data to file ...", show_times=show_times)
+        __echo_helper("Writing data to file ...", show_times=show_times, quiet=quiet)
         with open(outfile, 'w', encoding="utf-8") as fp:
-            if (minify is True):
-                json.dump(data, fp)
-            else:
-                json.dump(data, fp, indent=indent)
+            dump_json(data, fp, indent=indent, minify=minify)
         __echo_helper("Data has been saved to '%s'" % (outfile), show_times=show_times)
@@ -0,0 +1,275 @@
+import sys
+import click
+import pprint
+import pyaurorax
+from .helpers import (LOG_LEVEL_CHOICE,
+                      TERMINAL_OUTPUT_CHOICE,
+                      print_request_logs_table,
+                      print_request_status,
+                      fetch_request_status,
+                      fetch_request_statuses,
+                      get_search_data,
+                      echo_progress,
+                      load_json,
+                      render_search_template)
+
+
+def create_search_group(name, group_help, request_description, requests_description,
+                        search_module, query_to_search_kwargs):
+    """
+    Function to create the command group for a type of search request
+
+    The data product and ephemeris command groups only differ by the search
+    module and query parsing they use, so their commands are all
+    created here.
+
+    Args:
+        name: the name of the group, also used as the request type (ie. "ephemeris")
+        group_help: help message for the group
+        request_description: how to refer to a request in help messages (ie.
+            "an ephemeris search request")
+        requests_description: how to refer to several requests in help messages
+            (ie. "ephemeris search requests")
+        search_module: the pyaurorax module for this type of search (ie.
+            pyaurorax.ephemeris)
+        query_to_search_kwargs: function to convert a query into the arguments
+            used to create a search
+
+    Returns:
+        the click group
+    """
+    def create_search_object_from_query(q):
+        return search_module.Search(**query_to_search_kwargs(q))
+
+    @click.group(name, help=group_help)
+    def search_group():
+        pass
+
+    @search_group.command("get_status",
+                          short_help="Get status info for %s" % (requests_description),
+                          help="Get information for one or more %s\n\n\b\nREQUEST_UUIDS   the request "
+                          "unique identifiers" % (requests_description))
+    @click.argument("request_uuids", type=str, nargs=-1, required=True)
+    @click.option("--show-logs", "show_logs", is_flag=True,
+                  help="Show the logs for the request")
+    @click.option("--show-query", "show_query", is_flag=True,
+                  help="Show the query for the request")
+    @click.option("--filter-logs",
+                  type=LOG_LEVEL_CHOICE,
+                  help="Filter log messages (used with --show-logs)")
+    @click.option("--table-max-width", "--max-width", type=int,
+                  help="Max width for the logs table")
+    @click.pass_obj
+    def get_status(config, request_uuids, show_logs, show_query, filter_logs, table_max_width):
+        # get request statuses
+        statuses = fetch_request_statuses(name, request_uuids)
+
+        # print statuses nicely
+        for i in range(0, len(request_uuids)):
+            if (len(request_uuids) > 1):
+                click.echo("%sRequest ID:\t\t%s" % ("" if i == 0 else "\n", request_uuids[i]))
+            print_request_status(statuses[i],
+                                 show_logs=show_logs,
+                                 show_query=show_query,
+                                 filter_logs=filter_logs,
+                                 table_max_width=table_max_width)
+
+    @search_group.command("get_logs",
+                          short_help="Get logs for %s" % (request_description),
+                          help="Get the logs for %s\n\n\b\nREQUEST_UUID    the request "
+                          "unique identifier" % (request_description))
+    @click.argument("request_uuid", type=str)
+    @click.option("--filter", "--filter-logs", "filter_",
+                  type=LOG_LEVEL_CHOICE,
+                  help="Filter log messages")
+    @click.option("--table-max-width", "--max-width", type=int,
+                  help="Max width for the logs table")
+    @click.pass_obj
+    def get_logs(config, request_uuid, filter_, table_max_width):
+        # get request status
+        s = fetch_request_status(name, request_uuid)
+
+        # print out the logs nicely
+        if ("logs" in s):
+            print_request_logs_table(s["logs"],
+                                     filter_level=filter_,
+                                     table_max_width=table_max_width)
+        else:
+            click.echo("Search logs: missing, unable to display")
+
+    @search_group.command("get_query",
+                          short_help="Get query for %s" % (request_description),
+                          help="Get the query for %s\n\n\b\nREQUEST_UUID    the request "
+                          "unique identifier" % (request_description))
+    @click.argument("request_uuid", type=str)
+    @click.pass_obj
+    def get_query(config, request_uuid):
+        # get request status
+        s = fetch_request_status(name, request_uuid)
+
+        # print out query
+        if ("query" in s["search_request"]):
+            query_to_show = {k: v for k, v in s["search_request"]["query"].items() if k != "request_id"}
+            click.echo(pprint.pformat(query_to_show))
+        else:
+            click.echo("\nSearch query missing from request status, unable to display")
+
+    @search_group.command("get_data",
+                          short_help="Get data for %s" % (request_description),
+                          help="Get the data for %s\n\n\b\nREQUEST_UUID    the request "
+                          "unique identifier" % (request_description))
+    @click.argument("request_uuid", type=str)
+    @click.option("--outfile", type=str, help="output file to save data to (a .json file)")
+    @click.option("--output-to-terminal", type=TERMINAL_OUTPUT_CHOICE,
+                  help="output data to terminal in a certain format (instead of to file)")
+    @click.option("--indent", type=int, default=2, show_default=True,
+                  help="indentation when saving data to file")
+    @click.option("--minify", is_flag=True, help="Minify the JSON data saved to file")
+    @click.pass_obj
+    def get_data(config, request_uuid, outfile, output_to_terminal, indent, minify):
+        get_search_data(name,
+                        request_uuid,
+                        outfile,
+                        output_to_terminal,
+                        indent,
+                        minify)
+
+    @search_group.command("search_resubmit",
+                          short_help="Resubmit %s" % (request_description),
+                          help="Resubmit %s\n\n\b\nREQUEST_UUID    the request "
+                          "unique identifier" % (request_description))
+    @click.argument("request_uuid", type=str)
+    @click.option("--wait", is_flag=True,
+                  help="Wait for the new search to complete and get its data")
+    @click.option("--poll-interval",
+                  default=pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME,
+                  show_default=True,
+                  help="max polling interval when waiting for data (seconds, used with --wait)")
+    @click.option("--outfile", type=str, help="output file to save data to (a .json file, used with --wait)")
+    @click.option("--output-to-terminal", type=TERMINAL_OUTPUT_CHOICE,
+                  help="output data to terminal in a certain format (instead of to file, used with --wait)")
+    @click.option("--indent", type=int, default=2, show_default=True,
+                  help="indentation when saving data to file (used with --wait)")
+    @click.option("--minify", is_flag=True, help="Minify the JSON data saved to file (used with --wait)")
+    @click.pass_obj
+    def search_resubmit(config, request_uuid, wait, poll_interval, outfile,
+                        output_to_terminal, indent, minify):
+        # get request status
+        click.echo("Retrieving query for request '%s' ..." % (request_uuid))
+        status = fetch_request_status(name, request_uuid)
+
+        # set the query to use for resubmission
+        if ("query" not in status["search_request"]):
+            click.echo("Error resubmitting: missing query from original request ID")
+            sys.exit(1)
+        q = status["search_request"]["query"]
+
+        # create search object
+        click.echo("Preparing new search ...")
+        s = create_search_object_from_query(q)
+
+        # submit search
+        click.echo("Submitting new search ...")
+        s.execute()
+
+        # output new request ID
+        click.echo("Request has been resubmitted, new request ID is %s" % (s.request_id))
+
+        # wait for the new search and get its data, re-using the search object
+        if (wait is True):
+            s.wait(poll_interval=poll_interval, verbose=True)
+            get_search_data(name,
+                            s.request_id,
+                            outfile,
+                            output_to_terminal,
+                            indent,
+                            minify,
+                            show_times=True,
+                            search_obj=s)
+
+    @search_group.command("search_template",
+                          short_help="Output template for %s" % (request_description),
+                          help="Output template for %s" % (request_description))
+    @click.option("--outfile", type=str, help="save template to a file")
+    @click.option("--indent", type=int, default=2, show_default=True,
+                  help="indentation to use when outputing template")
+    @click.option("--minify", is_flag=True, help="Minify the template")
+    @click.pass_obj
+    def search_template(config, outfile, indent, minify):
+        # write the template to the file or stdout in one go
+        data = render_search_template(name, indent=indent, minify=minify)
+        if (outfile is not None):
+            with open(outfile, "wb") as fp:
+                fp.write(data)
+            click.echo("Saved template to %s" % (outfile))
+        else:
+            click.echo(data)
+
+    @search_group.command("search",
+                          short_help="Perform %s" % (request_description),
+                          help="Perform %s\n\n\b\nINFILE      input file with query "
+                          "(must be a JSON)" % (request_description))
+    @click.argument("infile", type=click.File("rb"))
+    @click.option("--poll-interval",
+                  default=pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME,
+                  show_default=True,
+                  help="max polling interval when waiting for data (seconds)")
+    @click.option("--outfile", type=str, help="output file to save data to (a .json file)")
+    @click.option("--output-to-terminal", type=TERMINAL_OUTPUT_CHOICE,
+                  help="output data to terminal in a certain format (instead of to file)")
+    @click.option("--indent", type=int, default=2, show_default=True,
+                  help="indentation when saving data to file")
+    @click.option("--minify", is_flag=True, help="Minify the JSON data saved to file")
+    @click.option("--quiet", is_flag=True, help="Quiet output")
+    @click.pass_obj
+    def search(config, infile, poll_interval, outfile, output_to_terminal, indent, minify, quiet):
+        # read in infile
+        echo_progress("Reading in query file ...", quiet=quiet)
+        q = load_json(infile)
+
+        # set search params
+        echo_progress("Preparing search ...", quiet=quiet)
+        search_kwargs = query_to_search_kwargs(q)
+        verbose_search = True if quiet is False else False  # pylint: disable=simplifiable-if-expression
+
+        # start search
+        s = search_module.search(**search_kwargs,
+                                 poll_interval=poll_interval,
+                                 verbose=verbose_search,
+                                 return_immediately=True)
+
+        # wait for data
+        s.wait(poll_interval=poll_interval, verbose=verbose_search)
+
+        # search has finished, save results to a file or output to terminal
+        get_search_data(name,
+                        s.request_id,
+                        outfile,
+                        output_to_terminal,
+                        indent,
+                        minify,
+                        show_times=True,
+                        search_obj=s,
+                        quiet=quiet)
+
+    @search_group.command("describe",
+                          short_help="Describe %s" % (request_description),
+                          help="Describe %s using\n\"SQL-like\" syntax\n\n\b\nINFILE      input "
+                          "file with query (must be a JSON)" % (request_description))
+    @click.argument("infile", type=click.File("rb"))
+    @click.pass_obj
+    def describe(config, infile):
+        # read in infile
+        q = load_json(infile)
+
+        # create search object
+        s = create_search_object_from_query(q)
+
+        # describe the search
+        d = search_module.describe(s)
+
+        # output
+        click.echo(d)
+
+    # return
+    return search_group
@@ -1,25 +1,57 @@
 import sys
-import pprint
+import json
 import click
 import humanize
 import pyaurorax
 import textwrap
+import functools
+from collections.abc import Sequence
 from texttable import Texttable
 
 # globals
-SUPPORTED_SOURCE_TYPES = [
+SUPPORTED_SOURCE_TYPES = (
     pyaurorax.sources.SOURCE_TYPE_EVENT_LIST,
     pyaurorax.sources.SOURCE_TYPE_GROUND,
     pyaurorax.sources.SOURCE_TYPE_HEO,
     pyaurorax.sources.SOURCE_TYPE_LEO,
     pyaurorax.sources.SOURCE_TYPE_LUNAR,
-]
-ALLOWED_FORMATS = [
+)
+ALLOWED_FORMATS = (
     pyaurorax.FORMAT_BASIC_INFO,
     pyaurorax.FORMAT_BASIC_INFO_WITH_METADATA,
     pyaurorax.FORMAT_IDENTIFIER_ONLY,
     pyaurorax.FORMAT_FULL_RECORD
-]
+)
+ORDER_COLUMNS = ("identifier", "program", "platform",
+                 "instrument_type", "display_name", "owner")
+
+# shared choices for the command options
+SOURCE_TYPE_CHOICE = click.Choice(SUPPORTED_SOURCE_TYPES)
+FORMAT_CHOICE = click.Choice(ALLOWED_FORMATS)
+ORDER_CHOICE = click.Choice(ORDER_COLUMNS)
+SOURCES_TABLE_HEADERS = ("Identifier", "Display Name", "Program",
+                         "Platform", "Instrument Type", "Source Type")
+SOURCES_TABLE_HEADERS_WITH_OWNER = SOURCES_TABLE_HEADERS + ("Owner",)
+SOURCES_TABLE_ORDER_HEADER_INDEX = {
+    "identifier": 0,
+    "display_name": 1,
+    "program": 2,
+    "platform": 3,
+    "instrument_type": 4,
+    "source_type": 5,
+    "owner": 6,
+}
+
+# sources table column settings (all columns are left aligned text), for
+# the tables without and with the owner column
+SOURCES_TABLE_COLS_DTYPE = {
+    False: ("t",) * len(SOURCES_TABLE_HEADERS),
+    True: ("t",) * len(SOURCES_TABLE_HEADERS_WITH_OWNER),
+}
+SOURCES_TABLE_COLS_ALIGN = {
+    False: ("l",) * len(SOURCES_TABLE_HEADERS),
+    True: ("l",) * len(SOURCES_TABLE_HEADERS_WITH_OWNER),
+}
 
 
 def __print_metadata_schema_table(ephemeris_schema=[], data_product_schema=[]):
@@ -88,6 +120,12 @@ def __print_metadata_schema_table(ephemeris_schema=[], data_product_schema=[]):
     click.echo(table.draw())
 
 
+def __format_metadata(metadata):
+    # metadata comes from JSON, so it's formatted as JSON (json's C encoder
+    # is much faster than pprint for large metadata)
+    return json.dumps(metadata, indent=2, default=str, ensure_ascii=False)
+
+
 def __print_single_data_source(ds, format):
     if (format == pyaurorax.FORMAT_IDENTIFIER_ONLY):
         click.echo("Identifier:\t\t%d" % (ds.identifier))
@@ -108,7 +146,7 @@ def __print_single_data_source(ds, format):
         if (ds.metadata == {}):
             click.echo("Metadata:\t\t%s" % (ds.metadata))
         else:
-            click.echo("Metadata:\n%s" % (pprint.pformat(ds.metadata)))
+            click.echo("Metadata:\n%s" % (__format_metadata(ds.metadata)))
     elif (format == pyaurorax.FORMAT_FULL_RECORD):
         click.echo("Identifier:\t\t%d" % (ds.identifier))
         click.echo("Program:\t\t%s" % (ds.program))
@@ -121,7 +159,7 @@ def __print_single_data_source(ds, format):
         if (ds.metadata == {}):
             click.echo("Metadata:\t\t%s" % (ds.metadata))
         else:
-            click.echo("Metadata:\n%s" % (pprint.pformat(ds.metadata)))
+            click.echo("Metadata:\n%s" % (__format_metadata(ds.metadata)))
         if (ds.ephemeris_metadata_schema == []):
             click.echo("Ephemeris Schema:\t[]")
         else:
@@ -134,6 +172,58 @@ def __print_single_data_source(ds, format):
                                       data_product_schema=ds.data_product_metadata_schema)
 
 
+def __split_comma_separated(value):
+    # split a comma separated option value, ignoring any empty items
+    if (value is None):
+        return []
+    return [v.strip() for v in value.split(',') if v.strip() != ""]
+
+
+def __print_sources_table(sources, order, show_owner):
+    # set table rows (in a single pass over the data sources, so any
+    # iterable can be used, such as the iterator returned by reversed())
+    table_rows = []
+    for source in sources:
+        row = [source.identifier,
+               source.display_name,
+               source.program,
+               source.platform,
+               source.instrument_type,
+               source.source_type]
+        if (show_owner is True):
+            row.append(source.owner)
+        table_rows.append(row)
+
+    # set header values (copied using unpacking since the list command
+    # below shadows the list builtin in this module)
+    table_headers = [*(SOURCES_TABLE_HEADERS_WITH_OWNER if show_owner is True else SOURCES_TABLE_HEADERS)]
+    order_index = SOURCES_TABLE_ORDER_HEADER_INDEX.get(order)
+    if (order_index is not None and order_index < len(table_headers)):
+        table_headers[order_index] += " " + "\u2193"
+
+    # output information
+    table = Texttable(max_width=400)
+    table.set_deco(Texttable.HEADER)
+    table.set_cols_dtype(SOURCES_TABLE_COLS_DTYPE[show_owner])
+    table.set_header_align(SOURCES_TABLE_COLS_ALIGN[show_owner])
+    table.set_cols_align(SOURCES_TABLE_COLS_ALIGN[show_owner])
+    table.header(table_headers)
+    table.add_rows(table_rows, header=False)
+    click.echo(table.draw())
+
+
+def __exit_on_aurorax_error(func):
+    # decorator for the commands, to print any AuroraX error and exit
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except pyaurorax.AuroraXException as e:
+            click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
+            sys.exit(1)
+    return wrapper
+
+
 @click.group("sources", help="Interact with data sources")
 def sources_group():
     pass
@@ -143,91 +233,39 @@ def sources_group():
 @click.option("--program", type=str, help="Filter using program")
 @click.option("--platform", type=str, help="Filter using platform")
 @click.option("--instrument-type", type=str, help="Filter using instrument type")
-@click.option("--source-type", type=click.Choice(SUPPORTED_SOURCE_TYPES),
+@click.option("--source-type", type=SOURCE_TYPE_CHOICE,
               help="Filter using source type")
 @click.option("--owner", type=str, help="Filter using an owner")
-@click.option("--order", type=click.Choice(["identifier", "program", "platform",
-                                            "instrument_type", "display_name",
-                                            "owner"]),
+@click.option("--order", type=ORDER_CHOICE,
               default="identifier", show_default=True,
               help="Order results using a certain column")
 @click.option("--reversed", "reversed_", is_flag=True, help="Reverse ordering")
 @click.pass_obj
+@__exit_on_aurorax_error
 def list(config, program, platform, instrument_type, source_type, owner, order, reversed_):
     """
     List data sources using the options to filter as desired
     """
     # get data sources
-    try:
-        sources = pyaurorax.sources.get_using_filters(program=program,
-                                                      platform=platform,
-                                                      instrument_type=instrument_type,
-                                                      source_type=source_type,
-                                                      owner=owner,
-                                                      order=order)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
-
-    # reverse
+    sources = pyaurorax.sources.get_using_filters(program=program,
+                                                  platform=platform,
+                                                  instrument_type=instrument_type,
+                                                  source_type=source_type,
+                                                  owner=owner,
+                                                  order=order)
+
+    # reverse (reversed() needs a sequence, so any other iterable is copied
+    # first; otherwise the sources aren't copied at all)
     if (reversed_ is True):
-        sources = reversed(sources)
+        sources = reversed(sources if isinstance(sources, Sequence) else [*sources])
 
     # decide if we want to show the owner
     show_owner = False
     if (owner is not None or order == "owner"):
         show_owner = True
 
-    # set table lists
-    table_identifiers = []
-    table_programs = []
-    table_platforms = []
-    table_instrument_types = []
-    table_source_types = []
-    table_display_names = []
-    table_owners = []
-    for source in sources:
-        table_identifiers.append(source.identifier)
-        table_programs.append(source.program)
-        table_platforms.append(source.platform)
-        table_instrument_types.append(source.instrument_type)
-        table_source_types.append(source.source_type)
-        table_display_names.append(source.display_name)
-        table_owners.append(source.owner)
-
-    # set header values
-    table_headers = ["Identifier", "Display Name", "Program",
-                     "Platform", "Instrument Type", "Source Type"]
-    if (show_owner is True):
-        table_headers.append("Owner")
-    for i in range(0, len(table_headers)):
-        if (table_headers[i].lower().replace(' ', '_') == order):
-            table_headers[i] += " " + "\u2193"
-
     # output information
-    table = Texttable(max_width=400)
-    table.set_deco(Texttable.HEADER)
-    table.set_cols_dtype(["t"] * len(table_headers))
-    table.set_header_align(["l"] * len(table_headers))
-    table.set_cols_align(["l"] * len(table_headers))
-    table.header(table_headers)
-    for i in range(0, len(table_identifiers)):
-        if (show_owner is True):
-            table.add_row([table_identifiers[i],
-                           table_display_names[i],
-                           table_programs[i],
-                           table_platforms[i],
-                           table_instrument_types[i],
-                           table_source_types[i],
-                           table_owners[i]])
-        else:
-            table.add_row([table_identifiers[i],
-                           table_display_names[i],
-                           table_programs[i],
-                           table_platforms[i],
-                           table_instrument_types[i],
-                           table_source_types[i]])
-    click.echo(table.draw())
+    __print_sources_table(sources, order, show_owner)
 
 
 @sources_group.command("search", short_help="Search for data sources")
@@ -237,134 +275,52 @@ def list(config, program, platform, instrument_type, source_type, owner, order,
               help="Search for platform (comma separate for multiple values)")
 @click.option("--instrument-types", type=str,
               help="Search for instrument type (comma separate for multiple values)")
-@click.option("--order", type=click.Choice(["identifier", "program", "platform",
-                                            "instrument_type", "display_name",
-                                            "owner"]),
+@click.option("--order", type=ORDER_CHOICE,
               default="identifier", show_default=True,
               help="Order results using a certain column")
 @click.option("--reversed", "reversed_", is_flag=True, help="Reverse ordering")
 @click.pass_obj
+@__exit_on_aurorax_error
 def search(config, programs, platforms, instrument_types, order, reversed_):
     """
     Search for data sources using the options to filter as desired. Unlike
     the 'list' command filters, this command supports multiple programs,
     platforms, or instrument types (using commas).
     """
-    # set programs values
-    parsed_programs = []
-    if (programs is None):
-        pass
-    elif (',' in programs):
-        for p in programs.split(','):
-            p = p.strip()
-            if (len(p) > 0):
-                parsed_programs.append(p)
-    else:
-        parsed_programs = [programs]
-
-    # set platforms values
-    parsed_platforms = []
-    if (platforms is None):
-        pass
-    elif (',' in platforms):
-        for p in platforms.split(','):
-            p = p.strip()
-            if (len(p) > 0):
-                parsed_platforms.append(p)
-    else:
-        parsed_platforms = [platforms]
-
-    # set instrument_types values
-    parsed_instrument_types = []
-    if (instrument_types is None):
-        pass
-    elif (',' in instrument_types):
-        for p in instrument_types.split(','):
-            p = p.strip()
-            if (len(p) > 0):
-                parsed_instrument_types.append(p)
-    else:
-        parsed_instrument_types = [instrument_types]
+    # set programs, platforms, and instrument_types values
+    parsed_programs = __split_comma_separated(programs)
+    parsed_platforms = __split_comma_separated(platforms)
+    parsed_instrument_types = __split_comma_separated(instrument_types)
 
     # search for data sources
-    try:
-        sources = pyaurorax.sources.search(programs=parsed_programs,
-                                           platforms=parsed_platforms,
-                                           instrument_types=parsed_instrument_types,
-                                           order=order)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
-
-    # reverse
+    sources = pyaurorax.sources.search(programs=parsed_programs,
+                                       platforms=parsed_platforms,
+                                       instrument_types=parsed_instrument_types,
+                                       order=order)
+
+    # reverse (reversed() needs a sequence, so any other iterable is copied
+    # first; otherwise the sources aren't copied at all)
     if (reversed_ is True):
-        sources = reversed(sources)
+        sources = reversed(sources if isinstance(sources, Sequence) else [*sources])
 
     # decide if we want to show the owner
     show_owner = False
     if (order == "owner"):
         show_owner = True
 
-    # set table lists
-    table_identifiers = []
-    table_programs = []
-    table_platforms = []
-    table_instrument_types = []
-    table_source_types = []
-    table_display_names = []
-    table_owners = []
-    for source in sources:
-        table_identifiers.append(source.identifier)
-        table_programs.append(source.program)
-        table_platforms.append(source.platform)
-        table_instrument_types.append(source.instrument_type)
-        table_source_types.append(source.source_type)
-        table_display_names.append(source.display_name)
-        table_owners.append(source.owner)
-
-    # set header values
-    table_headers = ["Identifier", "Display Name", "Program",
-                     "Platform", "Instrument Type", "Source Type"]
-    if (show_owner is True):
-        table_headers.append("Owner")
-    for i in range(0, len(table_headers)):
-        if (table_headers[i].lower().replace(' ', '_') == order):
-            table_headers[i] += " " + "\u2193"
-
     # output information
-    table = Texttable(max_width=400)
-    table.set_deco(Texttable.HEADER)
-    table.set_cols_dtype(["t"] * len(table_headers))
-    table.set_header_align(["l"] * len(table_headers))
-    table.set_cols_align(["l"] * len(table_headers))
-    table.header(table_headers)
-    for i in range(0, len(table_identifiers)):
-        if (show_owner is True):
-            table.add_row([table_identifiers[i],
-                           table_display_names[i],
-                           table_programs[i],
-                           table_platforms[i],
-                           table_instrument_types[i],
-                           table_source_types[i],
-                           table_owners[i]])
-        else:
-            table.add_row([table_identifiers[i],
-                           table_display_names[i],
-                           table_programs[i],
-                           table_platforms[i],
-                           table_instrument_types[i],
-                           table_source_types[i]])
-    click.echo(table.draw())
+    __print_sources_table(sources, order, show_owner)
 
 
 @sources_group.command("get", short_help="Get a single data source")
 @click.argument("program", type=str)
 @click.argument("platform", type=str)
 @click.argument("instrument_type", type=str)
-@click.option("--format", type=click.Choice(ALLOWED_FORMATS),
+@click.option("--format", type=FORMAT_CHOICE,
               default=pyaurorax.FORMAT_BASIC_INFO,
               help="Amount of data about the data source to retrieve")
 @click.pass_obj
+@__exit_on_aurorax_error
 def get(config, program, platform, instrument_type, format):
     """
     Get a single data source record
@@ -375,14 +331,10 @@ def get(config, program, platform, instrument_type, format):
     INSTRUMENT_TYPE   the instrument type value
     """
     # get the data source
-    try:
-        ds = pyaurorax.sources.get(program=program,
-                                   platform=platform,
-                                   instrument_type=instrument_type,
-                                   format=format)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    ds = pyaurorax.sources.get(program=program,
+                               platform=platform,
+                               instrument_type=instrument_type,
+                               format=format)
 
     # print it out nicely
     __print_single_data_source(ds, format)
@@ -391,10 +343,11 @@ def get(config, program, platform, instrument_type, format):
 @sources_group.command("get_using_identifier",
                        short_help="Get a single data source (using an identifier)")
 @click.argument("identifier", type=int)
-@click.option("--format", type=click.Choice(ALLOWED_FORMATS),
+@click.option("--format", type=FORMAT_CHOICE,
               default=pyaurorax.FORMAT_BASIC_INFO,
               help="Amount of data about the data source to retrieve")
 @click.pass_obj
+@__exit_on_aurorax_error
 def get_using_identifier(config, identifier, format):
     """
     Get a single data source record using an identifier
@@ -403,11 +356,7 @@ def get_using_identifier(config, identifier, format):
     IDENTIFIER     the identifier of the data source
     """
     # get data source
-    try:
-        ds = pyaurorax.sources.get_using_identifier(identifier, format=format)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    ds = pyaurorax.sources.get_using_identifier(identifier, format=format)
 
     # print it out nicely
     __print_single_data_source(ds, format)
@@ -415,10 +364,11 @@ def get_using_identifier(config, identifier, format):
 
 @sources_group.command("get_stats", short_help="Get statistics about a data source")
 @click.argument("identifier", type=int)
-@click.option("--format", type=click.Choice(ALLOWED_FORMATS),
+@click.option("--format", type=FORMAT_CHOICE,
               default=pyaurorax.FORMAT_BASIC_INFO,
               help="Amount of data about the data source to retrieve")
 @click.pass_obj
+@__exit_on_aurorax_error
 def get_stats(config, identifier, format):
     """
     Get statistics about a data source
@@ -427,12 +377,8 @@ def get_stats(config, identifier, format):
     IDENTIFIER     the identifier of the data source
     """
     # get stats information
-    try:
-        stats = pyaurorax.sources.get_stats(identifier,
-                                            format=format)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    stats = pyaurorax.sources.get_stats(identifier,
+                                        format=format)
 
     # print it out nicely
     click.echo("Data source:\t\t\t%s" % (stats.data_source))
@@ -448,10 +394,11 @@ def get_stats(config, identifier, format):
 @click.argument("program", type=str)
 @click.argument("platform", type=str)
 @click.argument("instrument_type", type=str)
-@click.argument("source_type", type=click.Choice(SUPPORTED_SOURCE_TYPES))
+@click.argument("source_type", type=SOURCE_TYPE_CHOICE)
 @click.argument("display_name", type=str)
 @click.option("--identifier", type=int, help="Custom identifier to use")
 @click.pass_obj
+@__exit_on_aurorax_error
 def add(config, program, platform, instrument_type, source_type, display_name, identifier):
     """
     Add a data source
@@ -463,19 +410,14 @@ def add(config, program, platform, instrument_type, source_type, display_name, i
     SOURCE_TYPE       the source type to set
     DISPLAY_NAME      the display name to set
     """
-    try:
-        new_ds = pyaurorax.sources.DataSource(identifier=identifier,
-                                              program=program,
-                                              platform=platform,
-                                              instrument_type=instrument_type,
-                                              source_type=source_type,
-                                              display_name=display_name)
-        added_ds = pyaurorax.sources.add(new_ds)
-        click.echo("Created data source successfully\n")
-        click.echo(added_ds)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    new_ds = pyaurorax.sources.DataSource(identifier=identifier,
+                                          program=program,
+                                          platform=platform,
+                                          instrument_type=instrument_type,
+                                          source_type=source_type,
+                                          display_name=display_name)
+    added_ds = pyaurorax.sources.add(new_ds)
+    click.echo("Created data source successfully\n\n%s" % (added_ds))
 
 
 @sources_group.command("update", short_help="Update a data source")
@@ -483,10 +425,11 @@ def add(config, program, platform, instrument_type, source_type, display_name, i
 @click.option("--program", type=str, help="New program value")
 @click.option("--platform", type=str, help="New platform value")
 @click.option("--instrument-type", type=str, help="New instrument type value")
-@click.option("--source-type", type=click.Choice(SUPPORTED_SOURCE_TYPES),
+@click.option("--source-type", type=SOURCE_TYPE_CHOICE,
               help="New source type value")
 @click.option("--display-name", type=str, help="New display name value")
 @click.pass_obj
+@__exit_on_aurorax_error
 def update(config, identifier, program, platform, instrument_type, source_type, display_name):
     """
     Update a data source
@@ -494,23 +437,19 @@ def update(config, identifier, program, platform, instrument_type, source_type,
     \b
     IDENTIFIER     the identifier of the data source
     """
-    try:
-        ds = pyaurorax.sources.update_partial(identifier,
-                                              program=program,
-                                              platform=platform,
-                                              instrument_type=instrument_type,
-                                              source_type=source_type,
-                                              display_name=display_name)
-        click.echo("Updated data source successfully\n")
-        click.echo(ds)
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    ds = pyaurorax.sources.update_partial(identifier,
+                                          program=program,
+                                          platform=platform,
+                                          instrument_type=instrument_type,
+                                          source_type=source_type,
+                                          display_name=display_name)
+    click.echo("Updated data source successfully\n\n%s" % (ds))
 
 
 @sources_group.command("delete", short_help="Delete a data source")
 @click.argument("identifier", type=int)
 @click.pass_obj
+@__exit_on_aurorax_error
 def delete(config, identifier):
     """
     Delete a data source
@@ -518,9 +457,5 @@ def delete(config, identifier):
     \b
     IDENTIFIER     the identifier of the data source
     """
-    try:
-        pyaurorax.sources.delete(identifier)
-        click.echo("Successfully deleted data source #%d" % (identifier))
-    except pyaurorax.AuroraXException as e:
-        click.echo("%s occurred: %s" % (type(e).__name__, e.args[0]))
-        sys.exit(1)
+    pyaurorax.sources.delete(identifier)
+    click.echo("Successfully deleted data source #%d" % (identifier))
@@ -155,3 +155,10 @@ EPHEMERIS_SEARCH_TEMPLATE = {
         }
     },
 }
+
+# templates for each search request type
+SEARCH_TEMPLATES = {
+    "conjunctions": CONJUNCTION_SEARCH_TEMPLATE,
+    "data_products": DATA_PRODUCTS_SEARCH_TEMPLATE,
+    "ephemeris": EPHEMERIS_SEARCH_TEMPLATE,
+}
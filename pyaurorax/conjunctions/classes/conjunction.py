@@ -4,6 +4,7 @@ Class definition for a conjunction
 
 import datetime
 from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
 from typing import Dict, List
 from ...sources import DataSource
 
@@ -35,6 +36,29 @@ class Conjunction(BaseModel):
     max_distance: float
     events: List[Dict]
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Conjunction":
+        """
+        Create a Conjunction object from a dictionary returned by the AuroraX
+        API, without validating it (much faster when creating many objects)
+
+        The start and end timestamps are still parsed, but the data sources
+        are expected to already be DataSource objects.
+
+        Args:
+            data: the conjunction dictionary
+
+        Returns:
+            a Conjunction object
+        """
+        return cls.construct(conjunction_type=data["conjunction_type"],
+                             start=parse_datetime(data["start"]),
+                             end=parse_datetime(data["end"]),
+                             data_sources=data["data_sources"],
+                             min_distance=data["min_distance"],
+                             max_distance=data["max_distance"],
+                             events=data["events"])
+
     def __str__(self) -> str:
         """
         String method
@@ -4,13 +4,16 @@ Class definition for a conjunction search
 
 import datetime
 import itertools
-from typing import Dict, List, Union, Optional
+import functools
+from typing import Dict, List, Tuple, Union, Optional
 from .conjunction import Conjunction
 from ...conjunctions import CONJUNCTION_TYPE_NBTRACE
 from ...api import AuroraXRequest, AuroraXResponse, urls
 from ...sources import DataSource, FORMAT_BASIC_INFO
 from ...exceptions import AuroraXBadParametersException
+from ..._internal.util import format_query_timestamp
 from ...requests import (STANDARD_POLLING_SLEEP_TIME,
+                         FIRST_FOLLOWUP_SLEEP_TIME,
                          cancel as requests_cancel,
                          wait_for_data as requests_wait_for_data,
                          get_data as requests_get_data,
@@ -19,6 +22,12 @@ from ...requests import (STANDARD_POLLING_SLEEP_TIME,
 # pdoc init
 __pdoc__: Dict = {}
 
+# allowed epoch search precision values (in seconds)
+EPOCH_SEARCH_PRECISIONS = (30, 60)
+
+# max number of criteria blocks (ground, space, and events) in a search
+MAX_CRITERIA_BLOCKS = 10
+
 
 class Search():
     """
@@ -102,24 +111,29 @@ class Search():
             a pyaurorax.conjunctions.Search object
     """
 
+    __slots__ = ("_start", "_end", "_start_str", "_end_str", "_ground", "_space",
+                 "_events", "_distance", "_conjunction_types", "_epoch_search_precision",
+                 "response_format", "request", "request_id", "request_url", "executed",
+                 "completed", "data_url", "_query", "_query_dirty", "status", "data", "logs")
+
     def __init__(self, start: datetime.datetime,
                  end: datetime.datetime,
                  distance: Union[int, float, Dict[str, Union[int, float]]],
-                 ground: Optional[List[Dict[str, str]]] = [],
-                 space: Optional[List[Dict[str, str]]] = [],
-                 events: Optional[List[Dict[str, str]]] = [],
-                 conjunction_types: Optional[List[str]] = [CONJUNCTION_TYPE_NBTRACE],
+                 ground: Optional[List[Dict[str, str]]] = None,
+                 space: Optional[List[Dict[str, str]]] = None,
+                 events: Optional[List[Dict[str, str]]] = None,
+                 conjunction_types: Optional[List[str]] = None,
                  epoch_search_precision: Optional[int] = 60,
                  response_format: Optional[Dict[str, bool]] = None):
 
         # set variables using passed in args
         self.start = start
         self.end = end
-        self.ground = ground
-        self.space = space
-        self.events = events
+        self.ground = [] if ground is None else ground
+        self.space = [] if space is None else space
+        self.events = [] if events is None else events
         self.distance = distance
-        self.conjunction_types = conjunction_types
+        self.conjunction_types = [CONJUNCTION_TYPE_NBTRACE] if conjunction_types is None else conjunction_types
         self.epoch_search_precision = epoch_search_precision
         self.response_format = response_format
 
@@ -130,6 +144,7 @@ class Search():
         self.executed: bool = False
         self.completed: bool = False
         self.data_url: str = ""
+        self._query: Optional[Dict] = None
         self.query: Dict = {}
         self.status: Dict = {}
         self.data: List[Union[Conjunction, Dict]] = []
@@ -164,9 +179,9 @@ class Search():
         Raises:
             pyaurorax.exceptions.AuroraXBadParametersException: too many criteria blocks are found
         """
-        if ((len(self.ground) + len(self.space) + len(self.events)) > 10):
-            raise AuroraXBadParametersException("Number of criteria blocks exceeds 10, "
-                                                "please reduce the count")
+        if ((len(self.ground) + len(self.space) + len(self.events)) > MAX_CRITERIA_BLOCKS):
+            raise AuroraXBadParametersException("Number of criteria blocks exceeds %d, "
+                                                "please reduce the count" % (MAX_CRITERIA_BLOCKS))
 
     def get_advanced_distances_combos(self, default_distance: Union[int, float] = None) -> Dict:
         """
@@ -178,40 +193,157 @@ class Search():
         Returns:
             the advanced distances combinations
         """
-        # set input arrays
-        options = []
-        for i in range(0, len(self.ground)):
-            options.append("ground%d" % (i + 1))
-        for i in range(0, len(self.space)):
-            options.append("space%d" % (i + 1))
-        for i in range(0, len(self.events)):
-            options.append("events%d" % (i + 1))
-
         # derive all combinations of options of size 2
-        combinations = {}
-        for element in itertools.combinations(options, r=2):
-            combinations["%s-%s" % (element[0], element[1])] = default_distance
+        combination_keys = self.__distance_combination_keys(len(self.ground),
+                                                            len(self.space),
+                                                            len(self.events))
+        combinations = dict.fromkeys(combination_keys, default_distance)
 
         # return
         return combinations
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def __distance_combination_keys(ground_count: int, space_count: int, events_count: int) -> Tuple[str, ...]:
+        # the keys only depend on the number of criteria blocks, so they're
+        # cached instead of being derived every time the distance is set
+        options = ([f"ground{i}" for i in range(1, ground_count + 1)]
+                   + [f"space{i}" for i in range(1, space_count + 1)]
+                   + [f"events{i}" for i in range(1, events_count + 1)])
+
+        # derive all combinations of options of size 2
+        return tuple(f"{a}-{b}" for a, b in itertools.combinations(options, r=2))
+
     def __fill_in_missing_distances(self, curr_distances: Dict) -> Dict:
         # get all distances possible
         all_distances = self.get_advanced_distances_combos()
 
+        # map each pair of options to its key, so that keys can be matched
+        # regardless of the order the two options are in
+        all_keys_lookup = {frozenset(all_key.split('-')): all_key for all_key in all_distances.keys()}
+
         # go through current distances and fill in the values
         for curr_key, curr_value in curr_distances.items():
             curr_key_split = curr_key.split('-')
             curr_key1 = curr_key_split[0].strip()
             curr_key2 = curr_key_split[1].strip()
-            for all_key in all_distances.keys():
-                if (curr_key1 in all_key and curr_key2 in all_key):
-                    # found the matching key, replace the value
-                    all_distances[all_key] = curr_value
+            all_key = all_keys_lookup.get(frozenset((curr_key1, curr_key2)))
+            if (all_key is not None):
+                # found the matching key, replace the value
+                all_distances[all_key] = curr_value
 
         # return
         return all_distances
 
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Property for the start parameter
+
+        Returns:
+            the start timestamp
+        """
+        return self._start
+
+    @start.setter
+    def start(self, start: datetime.datetime) -> None:
+        # format the timestamp for the query now, instead of each time the query is used
+        self._start = start
+        self._start_str = format_query_timestamp(start)
+        self._query_dirty = True
+
+    @property
+    def end(self) -> datetime.datetime:
+        """
+        Property for the end parameter
+
+        Returns:
+            the end timestamp
+        """
+        return self._end
+
+    @end.setter
+    def end(self, end: datetime.datetime) -> None:
+        # format the timestamp for the query now, instead of each time the query is used
+        self._end = end
+        self._end_str = format_query_timestamp(end)
+        self._query_dirty = True
+
+    @property
+    def ground(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Property for the ground parameter
+
+        Returns:
+            the ground instrument search parameters
+        """
+        return self._ground
+
+    @ground.setter
+    def ground(self, ground: Optional[List[Dict[str, str]]]) -> None:
+        self._ground = ground
+        self._query_dirty = True
+
+    @property
+    def space(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Property for the space parameter
+
+        Returns:
+            the space instrument search parameters
+        """
+        return self._space
+
+    @space.setter
+    def space(self, space: Optional[List[Dict[str, str]]]) -> None:
+        self._space = space
+        self._query_dirty = True
+
+    @property
+    def events(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Property for the events parameter
+
+        Returns:
+            the events search parameters
+        """
+        return self._events
+
+    @events.setter
+    def events(self, events: Optional[List[Dict[str, str]]]) -> None:
+        self._events = events
+        self._query_dirty = True
+
+    @property
+    def conjunction_types(self) -> Optional[List[str]]:
+        """
+        Property for the conjunction_types parameter
+
+        Returns:
+            the conjunction types
+        """
+        return self._conjunction_types
+
+    @conjunction_types.setter
+    def conjunction_types(self, conjunction_types: Optional[List[str]]) -> None:
+        self._conjunction_types = conjunction_types
+        self._query_dirty = True
+
+    @property
+    def epoch_search_precision(self) -> Optional[int]:
+        """
+        Property for the epoch_search_precision parameter
+
+        Returns:
+            the epoch search precision
+        """
+        return self._epoch_search_precision
+
+    @epoch_search_precision.setter
+    def epoch_search_precision(self, epoch_search_precision: Optional[int]) -> None:
+        self._epoch_search_precision = epoch_search_precision
+        self._query_dirty = True
+
     @property
     def distance(self) -> Union[int, float, Dict[str, Union[int, float]]]:
         """
@@ -225,11 +357,12 @@ class Search():
     @distance.setter
     def distance(self, distance: Union[int, float, Dict[str, Union[int, float]]]) -> None:
         # set distances to a dict if it's an int or float
-        if (type(distance) is int or type(distance) is float):
+        if (isinstance(distance, (int, float))):
             self._distance = self.get_advanced_distances_combos(default_distance=distance)  # type: ignore
         else:
             # is a dict, fill in any gaps
             self._distance = self.__fill_in_missing_distances(distance)  # type: ignore
+        self._query_dirty = True
 
     @property
     def query(self) -> Dict:
@@ -239,21 +372,30 @@ class Search():
         Returns:
             the query parameter
         """
+        # the query is only rebuilt if any of the search parameters
+        # have been changed since it was last built
+        if (self._query_dirty is False):
+            return self._query
         self._query = {
-            "start": self.start.strftime("%Y-%m-%dT%H:%M:%S"),
-            "end": self.end.strftime("%Y-%m-%dT%H:%M:%S"),
+            "start": self._start_str,
+            "end": self._end_str,
             "ground": self.ground,
             "space": self.space,
             "events": self.events,
             "conjunction_types": self.conjunction_types,
             "max_distances": self.distance,
-            "epoch_search_precision": self.epoch_search_precision if self.epoch_search_precision in [30, 60] else 60,
+            "epoch_search_precision": (self.epoch_search_precision
+                                       if self.epoch_search_precision in EPOCH_SEARCH_PRECISIONS else 60),
         }
+        self._query_dirty = False
         return self._query
 
     @query.setter
     def query(self, query: Dict) -> None:
+        # the query is always derived from the search parameters, so it
+        # will be rebuilt the next time it's used
         self._query = query
+        self._query_dirty = True
 
     def execute(self) -> None:
         """
@@ -262,7 +404,8 @@ class Search():
         Raises:
             pyaurorax.exceptions.AuroraXBadParametersException: too many criteria blocks
         """
-        # check number of criteria blocks
+        # check number of criteria blocks (before the query is built, so
+        # that invalid searches are rejected without doing that work)
         self.check_criteria_block_count_validity()
 
         # do request
@@ -277,7 +420,6 @@ class Search():
         self.executed = True
         if res.status_code == 202:
             # request successfully dispatched
-            self.executed = True
             self.request_url = res.request.headers["location"]
             self.request_id = self.request_url.rsplit("/", 1)[-1]
 
@@ -313,6 +455,11 @@ class Search():
         Returns:
             True if data is available, else False
         """
+        # the search has already finished, so no need to check again
+        if (self.completed is True):
+            return True
+
+        # check the status
         self.update_status()
         return self.completed
 
@@ -332,51 +479,63 @@ class Search():
         if (self.response_format is not None):
             self.data = raw_data
         else:
-            # cast data source objects
-            for i in range(0, len(raw_data)):
-                for j in range(0, len(raw_data[i]["data_sources"])):
-                    ds = DataSource(**raw_data[i]["data_sources"][j], format=FORMAT_BASIC_INFO)
-                    raw_data[i]["data_sources"][j] = ds
-
-            # cast conjunctions
-            self.data = [Conjunction(**c) for c in raw_data]
+            # cast conjunctions and their data source objects (in a single
+            # pass over the data)
+            conjunctions: List[Union[Conjunction, Dict]] = []
+            for c in raw_data:
+                c["data_sources"] = [DataSource.from_dict(ds, format=FORMAT_BASIC_INFO) for ds in c["data_sources"]]
+                conjunctions.append(Conjunction.from_dict(c))
+            self.data = conjunctions
 
     def wait(self,
              poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-             verbose: Optional[bool] = False) -> None:
+             verbose: Optional[bool] = False,
+             initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> None:
         """
         Block and wait until the request is complete and data is
         available for retrieval
 
         Args:
-            poll_interval: time in seconds to wait between polling attempts, defaults
+            poll_interval: max time in seconds to wait between polling attempts, defaults
                 to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
             verbose: output poll times and other progress messages, defaults to False
+            initial_poll_interval: time in seconds to wait before the first polling
+                attempt, defaults to pyaurorax.requests.FIRST_FOLLOWUP_SLEEP_TIME
         """
+        # the search has already finished, so there's nothing to wait for
+        if (self.completed is True):
+            return
+
+        # wait for the data
         url = urls.conjunction_request_url.format(self.request_id)
         self.update_status(requests_wait_for_data(url,
                                                   poll_interval=poll_interval,
-                                                  verbose=verbose))
+                                                  verbose=verbose,
+                                                  initial_poll_interval=initial_poll_interval))
 
     def cancel(self,
                wait: Optional[bool] = False,
                poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-               verbose: Optional[bool] = False) -> int:
+               verbose: Optional[bool] = False,
+               initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> int:
         """
         Cancel the conjunction search request
 
         This method returns immediately by default since the API processes
         this request asynchronously. If you would prefer to wait for it
         to be completed, set the 'wait' parameter to True. You can adjust
-        the polling time using the 'poll_interval' parameter.
+        the polling time using the 'poll_interval' and 'initial_poll_interval'
+        parameters.
 
         Args:
             wait: wait until the cancellation request has been
                 completed (may wait for several minutes)
-            poll_interval: seconds to wait between polling
+            poll_interval: max seconds to wait between polling
                 calls, defaults to STANDARD_POLLING_SLEEP_TIME.
             verbose: output poll times and other progress messages, defaults
                 to False
+            initial_poll_interval: seconds to wait before the first polling
+                call, defaults to FIRST_FOLLOWUP_SLEEP_TIME.
 
         Returns:
             1 on success
@@ -386,4 +545,8 @@ class Search():
             pyaurorax.exceptions.AuroraXUnauthorizedException: invalid API key for this operation
         """
         url = urls.conjunction_request_url.format(self.request_id)
-        return requests_cancel(url, wait=wait, poll_interval=poll_interval, verbose=verbose)
+        return requests_cancel(url,
+                               wait=wait,
+                               poll_interval=poll_interval,
+                               verbose=verbose,
+                               initial_poll_interval=initial_poll_interval)
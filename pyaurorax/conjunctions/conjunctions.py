@@ -8,7 +8,6 @@ import warnings
 from typing import Dict, List, Optional, Union
 from .classes.search import Search
 from ..api import AuroraXRequest, urls
-from ..conjunctions import CONJUNCTION_TYPE_NBTRACE
 from ..requests import STANDARD_POLLING_SLEEP_TIME
 
 # pdoc init
@@ -18,10 +17,10 @@ __pdoc__: Dict = {}
 def search(start: datetime.datetime,
            end: datetime.datetime,
            distance: Union[int, float, Dict[str, Union[int, float]]],
-           ground: Optional[List[Dict[str, str]]] = [],
-           space: Optional[List[Dict[str, str]]] = [],
-           events: Optional[List[Dict[str, str]]] = [],
-           conjunction_types: Optional[List[str]] = [CONJUNCTION_TYPE_NBTRACE],
+           ground: Optional[List[Dict[str, str]]] = None,
+           space: Optional[List[Dict[str, str]]] = None,
+           events: Optional[List[Dict[str, str]]] = None,
+           conjunction_types: Optional[List[str]] = None,
            epoch_search_precision: Optional[int] = 60,
            response_format: Optional[Dict[str, bool]] = None,
            poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
@@ -99,7 +98,7 @@ def search(start: datetime.datetime,
             30 or 60 seconds. Defaults to 60 seconds. Note - this parameter is under active
             development and still considered "alpha".
         response_format: JSON representation of desired data response format
-        poll_interval: seconds to wait between polling calls, defaults to
+        poll_interval: max seconds to wait between polling calls, defaults to
             pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
         return_immediately: initiate the search and return without waiting for data to
             be received, defaults to False
@@ -157,10 +156,10 @@ def search(start: datetime.datetime,
 def search_async(start: datetime.datetime,
                  end: datetime.datetime,
                  distance: Union[int, float, Dict[str, Union[int, float]]],
-                 ground: Optional[List[Dict[str, str]]] = [],
-                 space: Optional[List[Dict[str, str]]] = [],
-                 events: Optional[List[Dict[str, str]]] = [],
-                 conjunction_types: Optional[List[str]] = [CONJUNCTION_TYPE_NBTRACE],
+                 ground: Optional[List[Dict[str, str]]] = None,
+                 space: Optional[List[Dict[str, str]]] = None,
+                 events: Optional[List[Dict[str, str]]] = None,
+                 conjunction_types: Optional[List[str]] = None,
                  epoch_search_precision: Optional[int] = 60,
                  response_format: Optional[Dict[str, bool]] = None) -> Search:
     """
@@ -7,7 +7,9 @@ from typing import Dict, List, Union, Optional
 from .data_product import DataProduct
 from ...sources import DataSource, FORMAT_BASIC_INFO
 from ...api import AuroraXRequest, AuroraXResponse, urls
+from ..._internal.util import format_query_timestamp
 from ...requests import (STANDARD_POLLING_SLEEP_TIME,
+                         FIRST_FOLLOWUP_SLEEP_TIME,
                          cancel as requests_cancel,
                          wait_for_data as requests_wait_for_data,
                          get_data as requests_get_data,
@@ -57,6 +59,11 @@ class Search():
         logs: all log messages outputed by the AuroraX API for this request
     """
 
+    __slots__ = ("start", "end", "programs", "platforms", "instrument_types", "data_product_types",
+                 "metadata_filters", "metadata_filters_logical_operator", "response_format",
+                 "request", "request_id", "request_url", "executed", "completed", "data_url",
+                 "_query", "status", "data", "logs")
+
     def __init__(self,
                  start: datetime.datetime,
                  end: datetime.datetime,
@@ -117,18 +124,18 @@ class Search():
         """
         self._query = {
             "data_sources": {
-                "programs": [] if not self.programs else self.programs,
-                "platforms": [] if not self.platforms else self.platforms,
-                "instrument_types": [] if not self.instrument_types else self.instrument_types,
+                "programs": self.programs or [],
+                "platforms": self.platforms or [],
+                "instrument_types": self.instrument_types or [],
                 "data_product_metadata_filters": {} if not self.metadata_filters
                 else {
                     "logical_operator": self.metadata_filters_logical_operator,
                     "expressions": self.metadata_filters
                 },
             },
-            "start": self.start.strftime("%Y-%m-%dT%H:%M:%S"),
-            "end": self.end.strftime("%Y-%m-%dT%H:%M:%S"),
-            "data_product_type_filters": [] if not self.data_product_types else self.data_product_types,
+            "start": format_query_timestamp(self.start),
+            "end": format_query_timestamp(self.end),
+            "data_product_type_filters": self.data_product_types or [],
         }
         return self._query
 
@@ -152,7 +159,6 @@ class Search():
         self.executed = True
         if (res.status_code == 202):
             # request successfully dispatched
-            self.executed = True
             self.request_url = res.request.headers["location"]
             self.request_id = self.request_url.rsplit("/", 1)[-1]
 
@@ -189,6 +195,11 @@ class Search():
         Returns:
             True if data is available, else False
         """
+        # the search has already finished, so no need to check again
+        if (self.completed is True):
+            return True
+
+        # check the status
         self.update_status()
         return self.completed
 
@@ -208,51 +219,62 @@ class Search():
         if self.response_format is not None:
             self.data = raw_data
         else:
-            # cast data source objects
-            for i in range(0, len(raw_data)):
-                ds = DataSource(**raw_data[i]["data_source"], format=FORMAT_BASIC_INFO)
-                raw_data[i]["data_source"] = ds
-
-            # cast data product objects
+            # cast data source and data product objects (the data sources come
+            # straight from the API, so they aren't validated again)
+            for dp in raw_data:
+                dp["data_source"] = DataSource.from_dict(dp["data_source"], format=FORMAT_BASIC_INFO)
             self.data = [DataProduct(**dp) for dp in raw_data]
 
     def wait(self,
              poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-             verbose: Optional[bool] = False) -> None:
+             verbose: Optional[bool] = False,
+             initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> None:
         """
         Block and wait for the request to complete and data is available
         for retrieval
 
         Args:
-            poll_interval: time in seconds to wait between polling attempts,
+            poll_interval: max time in seconds to wait between polling attempts,
                 defaults to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
             verbose: output poll times and other progress messages, defaults
                 to False
+            initial_poll_interval: time in seconds to wait before the first polling
+                attempt, defaults to pyaurorax.requests.FIRST_FOLLOWUP_SLEEP_TIME
         """
+        # the search has already finished, so there's nothing to wait for
+        if (self.completed is True):
+            return
+
+        # wait for the data
         url = urls.data_products_request_url.format(self.request_id)
         self.update_status(requests_wait_for_data(url,
                                                   poll_interval=poll_interval,
-                                                  verbose=verbose))
+                                                  verbose=verbose,
+                                                  initial_poll_interval=initial_poll_interval))
 
     def cancel(self,
                wait: Optional[bool] = False,
                poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-               verbose: Optional[bool] = False) -> int:
+               verbose: Optional[bool] = False,
+               initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> int:
         """
         Cancel the data product search request
 
         This method returns immediately by default since the API processes
         this request asynchronously. If you would prefer to wait for it
         to be completed, set the 'wait' parameter to True. You can adjust
-        the polling time using the 'poll_interval' parameter.
+        the polling time using the 'poll_interval' and 'initial_poll_interval'
+        parameters.
 
         Args:
             wait: wait until the cancellation request has been
                 completed (may wait for several minutes)
-            poll_interval: seconds to wait between polling
+            poll_interval: max seconds to wait between polling
                 calls, defaults to STANDARD_POLLING_SLEEP_TIME.
             verbose: output poll times and other progress messages, defaults
                 to False
+            initial_poll_interval: seconds to wait before the first polling
+                call, defaults to FIRST_FOLLOWUP_SLEEP_TIME.
 
         Returns:
             1 on success
@@ -262,4 +284,8 @@ class Search():
             pyaurorax.exceptions.AuroraXUnauthorizedException: invalid API key for this operation
         """
         url = urls.data_products_request_url.format(self.request_id)
-        return requests_cancel(url, wait=wait, poll_interval=poll_interval, verbose=verbose)
+        return requests_cancel(url,
+                               wait=wait,
+                               poll_interval=poll_interval,
+                               verbose=verbose,
+                               initial_poll_interval=initial_poll_interval)
@@ -99,7 +99,7 @@ def search(start: datetime.datetime,
             evaluating metadata filters (either 'AND' or 'OR'), defaults
             to "AND"
         response_format: JSON representation of desired data response format
-        poll_interval: time in seconds to wait between polling attempts, defaults
+        poll_interval: max time in seconds to wait between polling attempts, defaults
             to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
         return_immediately: initiate the search and return without waiting for data to
             be received, defaults to False
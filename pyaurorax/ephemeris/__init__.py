@@ -10,6 +10,7 @@ here instead of digging in deeper to the submodules.
 # function and class imports
 from .ephemeris import (search_async,
                         search,
+                        search_batch,
                         upload,
                         delete,
                         describe)
@@ -26,6 +27,7 @@ __pdoc__ = dict(__pdoc__, **__classes_search_pdoc__)
 __all__ = [
     "search_async",
     "search",
+    "search_batch",
     "upload",
     "delete",
     "describe",
@@ -34,6 +34,26 @@ class Ephemeris(BaseModel):
     sbtrace: Location
     metadata: Optional[Dict] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Ephemeris":
+        """
+        Create an Ephemeris object from a record returned by the AuroraX
+        API, without validating it (much faster when creating many objects)
+
+        The record is expected to already have its epoch as a datetime,
+        its locations as Location objects, and its data source as a
+        DataSource object (ie. as returned by pyaurorax.requests.get_data).
+
+        Args:
+            data: the ephemeris record dictionary
+
+        Returns:
+            an Ephemeris object
+        """
+        # only keep known fields, since any extra keys sent by the API
+        # aren't dropped like they are when validating
+        return cls.construct(**{k: v for k, v in data.items() if k in cls.__fields__})
+
     def to_json_serializable(self) -> Dict:
         """
         Convert object to a JSON-serializable object (ie. translate
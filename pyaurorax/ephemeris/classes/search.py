@@ -8,7 +8,9 @@ from .ephemeris import Ephemeris
 from ...api import AuroraXRequest, AuroraXResponse, urls
 from ...sources import DataSource, FORMAT_BASIC_INFO
 from ...exceptions import (AuroraXBadParametersException)
+from ..._internal.util import format_query_timestamp
 from ...requests import (STANDARD_POLLING_SLEEP_TIME,
+                         FIRST_FOLLOWUP_SLEEP_TIME,
                          cancel as requests_cancel,
                          wait_for_data as requests_wait_for_data,
                          get_data as requests_get_data,
@@ -57,6 +59,11 @@ class Search():
         logs: all log messages outputed by the AuroraX API for this request
     """
 
+    __slots__ = ("_start", "_end", "_start_str", "_end_str", "_programs", "_platforms",
+                 "_instrument_types", "_metadata_filters", "_metadata_filters_logical_operator",
+                 "response_format", "request", "request_id", "request_url", "executed",
+                 "completed", "data_url", "_query", "_query_dirty", "status", "data", "logs")
+
     def __init__(self,
                  start: datetime.datetime,
                  end: datetime.datetime,
@@ -108,30 +115,151 @@ class Search():
         return f"EphemerisSearch(executed={self.executed}, " \
             f"completed={self.completed}, request_id='{self.request_id}')"
 
+    @property
+    def start(self) -> datetime.datetime:
+        """
+        Property for the start parameter
+
+        Returns:
+            the start timestamp
+        """
+        return self._start
+
+    @start.setter
+    def start(self, start: datetime.datetime) -> None:
+        # format the timestamp for the query now, instead of each time the query is used
+        self._start = start
+        self._start_str = format_query_timestamp(start)
+        self._query_dirty = True
+
+    @property
+    def end(self) -> datetime.datetime:
+        """
+        Property for the end parameter
+
+        Returns:
+            the end timestamp
+        """
+        return self._end
+
+    @end.setter
+    def end(self, end: datetime.datetime) -> None:
+        # format the timestamp for the query now, instead of each time the query is used
+        self._end = end
+        self._end_str = format_query_timestamp(end)
+        self._query_dirty = True
+
+    @property
+    def programs(self) -> Optional[List[str]]:
+        """
+        Property for the programs parameter
+
+        Returns:
+            the programs to search through
+        """
+        return self._programs
+
+    @programs.setter
+    def programs(self, programs: Optional[List[str]]) -> None:
+        self._programs = programs
+        self._query_dirty = True
+
+    @property
+    def platforms(self) -> Optional[List[str]]:
+        """
+        Property for the platforms parameter
+
+        Returns:
+            the platforms to search through
+        """
+        return self._platforms
+
+    @platforms.setter
+    def platforms(self, platforms: Optional[List[str]]) -> None:
+        self._platforms = platforms
+        self._query_dirty = True
+
+    @property
+    def instrument_types(self) -> Optional[List[str]]:
+        """
+        Property for the instrument_types parameter
+
+        Returns:
+            the instrument types to search through
+        """
+        return self._instrument_types
+
+    @instrument_types.setter
+    def instrument_types(self, instrument_types: Optional[List[str]]) -> None:
+        self._instrument_types = instrument_types
+        self._query_dirty = True
+
+    @property
+    def metadata_filters(self) -> Optional[List[Dict]]:
+        """
+        Property for the metadata_filters parameter
+
+        Returns:
+            the metadata filters
+        """
+        return self._metadata_filters
+
+    @metadata_filters.setter
+    def metadata_filters(self, metadata_filters: Optional[List[Dict]]) -> None:
+        self._metadata_filters = metadata_filters
+        self._query_dirty = True
+
+    @property
+    def metadata_filters_logical_operator(self) -> Optional[str]:
+        """
+        Property for the metadata_filters_logical_operator parameter
+
+        Returns:
+            the logical operator used for the metadata filters
+        """
+        return self._metadata_filters_logical_operator
+
+    @metadata_filters_logical_operator.setter
+    def metadata_filters_logical_operator(self, metadata_filters_logical_operator: Optional[str]) -> None:
+        self._metadata_filters_logical_operator = metadata_filters_logical_operator
+        self._query_dirty = True
+
     @property
     def query(self):
         """
         Property for the query value
         """
+        # the query is only rebuilt if any of the search parameters
+        # have been changed since it was last built. The parameter lists
+        # are referenced (not copied) by the query so that changing them
+        # in place is still picked up, and the metadata filters are
+        # checked since the query is different when there are none.
+        if (self._query_dirty is False
+                and bool(self.metadata_filters) == ("expressions" in self._query["data_sources"]["ephemeris_metadata_filters"])):
+            return self._query
         self._query = {
             "data_sources": {
-                "programs": [] if not self.programs else self.programs,
-                "platforms": [] if not self.platforms else self.platforms,
-                "instrument_types": [] if not self.instrument_types else self.instrument_types,
+                "programs": self.programs if self.programs is not None else [],
+                "platforms": self.platforms if self.platforms is not None else [],
+                "instrument_types": self.instrument_types if self.instrument_types is not None else [],
                 "ephemeris_metadata_filters": {} if not self.metadata_filters
                 else {
                     "logical_operator": self.metadata_filters_logical_operator,
                     "expressions": self.metadata_filters
                 },
             },
-            "start": self.start.strftime("%Y-%m-%dT%H:%M:%S"),
-            "end": self.end.strftime("%Y-%m-%dT%H:%M:%S"),
+            "start": self._start_str,
+            "end": self._end_str,
         }
+        self._query_dirty = False
         return self._query
 
     @query.setter
     def query(self, query):
+        # the query is always derived from the search parameters, so it
+        # will be rebuilt the next time it's used
         self._query = query
+        self._query_dirty = True
 
     def execute(self) -> None:
         """
@@ -157,7 +285,6 @@ class Search():
         self.executed = True
         if (res.status_code == 202):
             # request successfully dispatched
-            self.executed = True
             self.request_url = res.request.headers["location"]
             self.request_id = self.request_url.rsplit("/", 1)[-1]
 
@@ -194,6 +321,11 @@ class Search():
         Returns:
             True if data is available, else False
         """
+        # the search has already finished, so no need to check again
+        if (self.completed is True):
+            return True
+
+        # check the status
         self.update_status()
         return self.completed
 
@@ -214,51 +346,62 @@ class Search():
         if self.response_format is not None:
             self.data = raw_data
         else:
-            # cast data source objects
-            for i in range(0, len(raw_data)):
-                ds = DataSource(**raw_data[i]["data_source"], format=FORMAT_BASIC_INFO)
-                raw_data[i]["data_source"] = ds
-
-            # cast ephemeris objects
-            self.data = [Ephemeris(**e) for e in raw_data]
+            # cast ephemeris and data source objects (the records were
+            # already converted by get_data, so they aren't validated again)
+            for e in raw_data:
+                e["data_source"] = DataSource.from_dict(e["data_source"], format=FORMAT_BASIC_INFO)
+            self.data = [Ephemeris.from_dict(e) for e in raw_data]
 
     def wait(self,
              poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-             verbose: Optional[bool] = False) -> None:
+             verbose: Optional[bool] = False,
+             initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> None:
         """
         Block and wait for the request to complete and data is
         available for retrieval
 
         Args:
-            poll_interval: time in seconds to wait between polling attempts,
+            poll_interval: max time in seconds to wait between polling attempts,
                 defaults to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
             verbose: output poll times and other progress messages, defaults
                 to False
+            initial_poll_interval: time in seconds to wait before the first polling
+                attempt, defaults to pyaurorax.requests.FIRST_FOLLOWUP_SLEEP_TIME
         """
+        # the search has already finished, so there's nothing to wait for
+        if (self.completed is True):
+            return
+
+        # wait for the data
         url = urls.ephemeris_request_url.format(self.request_id)
         self.update_status(requests_wait_for_data(url,
                                                   poll_interval=poll_interval,
-                                                  verbose=verbose))
+                                                  verbose=verbose,
+                                                  initial_poll_interval=initial_poll_interval))
 
     def cancel(self,
                wait: Optional[bool] = False,
                poll_interval: float = STANDARD_POLLING_SLEEP_TIME,
-               verbose: Optional[bool] = False) -> int:
+               verbose: Optional[bool] = False,
+               initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> int:
         """
         Cancel the ephemeris search request
 
         This method returns immediately by default since the API processes
         this request asynchronously. If you would prefer to wait for it
         to be completed, set the 'wait' parameter to True. You can adjust
-        the polling time using the 'poll_interval' parameter.
+        the polling time using the 'poll_interval' and 'initial_poll_interval'
+        parameters.
 
         Args:
             wait: wait until the cancellation request has been
                 completed (may wait for several minutes)
-            poll_interval: seconds to wait between polling
+            poll_interval: max seconds to wait between polling
                 calls, defaults to STANDARD_POLLING_SLEEP_TIME.
             verbose: output poll times and other progress messages, defaults
                 to False
+            initial_poll_interval: seconds to wait before the first polling
+                call, defaults to FIRST_FOLLOWUP_SLEEP_TIME.
 
         Returns:
             1 on success
@@ -268,4 +411,8 @@ class Search():
             pyaurorax.exceptions.AuroraXUnauthorizedException: invalid API key for this operation
         """
         url = urls.ephemeris_request_url.format(self.request_id)
-        return requests_cancel(url, wait=wait, poll_interval=poll_interval, verbose=verbose)
+        return requests_cancel(url,
+                               wait=wait,
+                               poll_interval=poll_interval,
+                               verbose=verbose,
+                               initial_poll_interval=initial_poll_interval)
@@ -5,6 +5,7 @@ Functions for performing ephemeris searches
 import datetime
 import humanize
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from .classes.ephemeris import Ephemeris
 from .classes.search import Search
@@ -13,7 +14,9 @@ from ..sources import (DataSource,
 from ..exceptions import (AuroraXValidationException,
                           AuroraXUploadException,
                           AuroraXBadParametersException)
-from ..requests import STANDARD_POLLING_SLEEP_TIME
+from ..requests import (STANDARD_POLLING_SLEEP_TIME,
+                        MAX_BATCH_WORKERS,
+                        wait_for_data_batch as requests_wait_for_data_batch)
 from ..api import (AuroraXRequest, urls)
 
 # pdoc init
@@ -92,8 +95,8 @@ def search(start: datetime.datetime,
             evaluating metadata filters (either 'AND' or 'OR'), defaults
             to "AND"
         response_format: JSON representation of desired data response format
-        poll_interval: time in seconds to wait between polling attempts, defaults
-            to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
+        poll_interval: max time in seconds to wait between polling attempts,
+            defaults to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
         return_immediately: initiate the search and return without waiting for data to
             be received, defaults to False
         verbose: output poll times and other progress messages, defaults to False
@@ -147,6 +150,94 @@ def search(start: datetime.datetime,
     return s
 
 
+def search_batch(searches: List[Search],
+                 poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
+                 return_immediately: Optional[bool] = False,
+                 verbose: Optional[bool] = False,
+                 max_workers: Optional[int] = MAX_BATCH_WORKERS) -> List[Search]:
+    """
+    Perform several ephemeris searches at the same time
+
+    The searches are submitted at the same time, and then waited on using
+    a single polling loop (see pyaurorax.requests.wait_for_data_batch)
+    instead of one loop per search. This is useful for running many
+    similar searches, such as one search per day over a month.
+
+    By default, this function will block and wait until all the requests
+    complete and their data is downloaded. If you don't want to wait, set
+    the 'return_immediately` value to True.
+
+    Args:
+        searches: the pyaurorax.ephemeris.Search objects to perform
+        poll_interval: max time in seconds to wait between polling attempts,
+            defaults to pyaurorax.requests.STANDARD_POLLING_SLEEP_TIME
+        return_immediately: initiate the searches and return without waiting for
+            data to be received, defaults to False
+        verbose: output poll times and other progress messages, defaults to False
+        max_workers: max number of requests made at the same time, defaults
+            to pyaurorax.requests.MAX_BATCH_WORKERS
+
+    Returns:
+        the pyaurorax.ephemeris.Search objects, in the same order they
+        were given
+
+    Raises:
+        pyaurorax.exceptions.AuroraXBadParametersException: missing parameters. If
+            any search fails to be submitted, the searches that were submitted are
+            cancelled and the first error is re-raised
+    """
+    # nothing to do
+    if (len(searches) == 0):
+        return searches
+
+    if (max_workers is None):
+        max_workers = MAX_BATCH_WORKERS
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(searches))) as executor:
+        # execute the searches, collecting any errors instead of stopping at
+        # the first one so that we know which searches were submitted
+        futures = [executor.submit(s.execute) for s in searches]
+        errors = [e for e in [f.exception() for f in futures] if e is not None]
+        if (len(errors) > 0):
+            # cancel the searches that were submitted, so they aren't left
+            # running on the server, and then re-raise the first error
+            for s in searches:
+                if (s.request_id != ""):
+                    try:
+                        s.cancel()
+                    except Exception as e:
+                        warnings.warn("Unable to cancel ephemeris search request %s: %s" % (s.request_id, str(e)))
+            raise errors[0]
+        if (verbose is True):
+            print("[%s] %d requests submitted" % (datetime.datetime.now(), len(searches)))
+
+        # return immediately if we wanted to
+        if (return_immediately is True):
+            return searches
+
+        # wait for data
+        if (verbose is True):
+            print("[%s] Waiting for data ..." % (datetime.datetime.now()))
+        request_urls = [urls.ephemeris_request_url.format(s.request_id) for s in searches]
+        statuses = requests_wait_for_data_batch(request_urls,
+                                                poll_interval=poll_interval,
+                                                verbose=verbose,
+                                                max_workers=max_workers)
+        for s, status in zip(searches, statuses):
+            s.update_status(status)
+
+        # get the data
+        if (verbose is True):
+            print("[%s] Retrieving data ..." % (datetime.datetime.now()))
+        list(executor.map(Search.get_data, searches))
+
+    # return the searches with their data
+    if (verbose is True):
+        print("[%s] Retrieved data containing %d records" % (datetime.datetime.now(),
+                                                             sum(len(s.data) for s in searches)))
+    return searches
+
+
 def search_async(start: datetime.datetime,
                  end: datetime.datetime,
                  programs: Optional[List[str]] = None,
@@ -10,10 +10,16 @@ here instead of digging in deeper to the submodules.
 # function and class imports
 from .requests import (FIRST_FOLLOWUP_SLEEP_TIME,
                        STANDARD_POLLING_SLEEP_TIME,
+                       POLLING_BACKOFF_FACTOR,
+                       POLLING_JITTER,
+                       MAX_BATCH_WORKERS,
+                       STATUS_CACHE_MAX_SIZE,
                        get_data,
                        get_logs,
                        get_status,
+                       get_status_batch,
                        wait_for_data,
+                       wait_for_data_batch,
                        cancel)
 
 # pdoc imports and exports
@@ -22,9 +28,15 @@ __pdoc__ = __requests_pdoc__
 __all__ = [
     "FIRST_FOLLOWUP_SLEEP_TIME",
     "STANDARD_POLLING_SLEEP_TIME",
+    "POLLING_BACKOFF_FACTOR",
+    "POLLING_JITTER",
+    "MAX_BATCH_WORKERS",
+    "STATUS_CACHE_MAX_SIZE",
     "get_data",
     "get_logs",
     "get_status",
+    "get_status_batch",
     "wait_for_data",
+    "wait_for_data_batch",
     "cancel",
 ]
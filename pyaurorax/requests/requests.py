@@ -2,9 +2,17 @@
 Functions for interacting with AuroraX requests
 """
 
+import os
+import copy
 import datetime
+import random
 import time
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
+from ..api import get_api_key
 from ..api.classes.request import AuroraXRequest
 from ..exceptions import AuroraXDataRetrievalError
 from ..location import Location
@@ -19,25 +27,162 @@ FIRST_FOLLOWUP_SLEEP_TIME: float = 0.050  # 50ms
 STANDARD_POLLING_SLEEP_TIME: float = 1.0  # 1s
 """ Polling sleep time when waiting for data (after the initial sleep time) """
 
+MIN_POLLING_SLEEP_TIME: float = 0.010  # 10ms
+""" Min sleep time between polling calls when waiting for data, so that the API is never polled without a delay """
+
+POLLING_BACKOFF_FACTOR: float = 1.5
+"""
+Factor the sleep time grows by after each poll when waiting for data, from
+the initial sleep time up to the polling sleep time
+"""
+
+POLLING_JITTER: float = 0.1  # up to 10%
+""" Max random fraction added to each polling sleep time, so that clients don't poll in lockstep """
+
+
+def __get_max_batch_workers(default: int = 8) -> int:
+    # read the max batch workers from the environment, falling back to the
+    # default if it isn't a valid number (so that importing doesn't fail)
+    value = os.getenv("PYAURORAX_MAX_BATCH_WORKERS", str(default))
+    try:
+        return max(1, int(value))
+    except ValueError:
+        warnings.warn("Invalid PYAURORAX_MAX_BATCH_WORKERS value '%s', using %d instead" % (value, default))
+        return default
+
+
+MAX_BATCH_WORKERS: int = __get_max_batch_workers()
+"""
+Max number of requests made at the same time when retrieving a batch of
+request statuses (can be set using the PYAURORAX_MAX_BATCH_WORKERS environment
+variable)
+"""
+
+STATUS_CACHE_MAX_SIZE: int = 256
+"""
+Max number of request statuses kept for conditional requests (statuses are
+only kept if the API sends an ETag or Last-Modified header with them)
+"""
+
+# record fields that are converted into Location objects when retrieving data
+LOCATION_FIELDS = ("location_geo", "location_gsm", "nbtrace", "sbtrace")
+
+# recently retrieved request statuses and their validators, keyed by request URL
+# and API key (so that statuses aren't shared between API keys)
+__status_cache: OrderedDict = OrderedDict()
+__status_cache_lock = threading.Lock()
+
+
+def __parse_epoch(value: str) -> datetime.datetime:
+    # datetime.fromisoformat is much faster than strptime, but is only
+    # available in Python 3.7+
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except (AttributeError, ValueError):
+        return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+
+
+def __get_first_sleep_time(initial_poll_interval: Optional[float], poll_interval: Optional[float]) -> float:
+    # use the default for any interval that wasn't given, and never sleep for
+    # less than the minimum so that the API isn't polled without a delay
+    if (initial_poll_interval is None):
+        initial_poll_interval = FIRST_FOLLOWUP_SLEEP_TIME
+    if (poll_interval is None):
+        poll_interval = STANDARD_POLLING_SLEEP_TIME
+    return max(MIN_POLLING_SLEEP_TIME, min(initial_poll_interval, poll_interval))
+
+
+def __poll_sleep(sleep_time: float, poll_interval: Optional[float]) -> float:
+    # sleep with some jitter, and return the next (backed off) sleep time
+    time.sleep(sleep_time + random.uniform(0, sleep_time * POLLING_JITTER))  # nosec
+    if (poll_interval is None):
+        poll_interval = STANDARD_POLLING_SLEEP_TIME
+    return max(MIN_POLLING_SLEEP_TIME, min(poll_interval, sleep_time * POLLING_BACKOFF_FACTOR))
+
 
 def get_status(request_url: str) -> Dict:
     """
     Retrieve the status of a request
 
+    If a previous status for this request was sent with an ETag or
+    Last-Modified header, the request is made conditional so that the
+    API doesn't need to send the status again if it hasn't changed. The
+    previously retrieved status is returned in that case (as a copy, so
+    it is safe to modify).
+
     Args:
         request_url: the URL of the request information
 
     Returns:
         the status information for the request
     """
+    # set conditional request headers if we have a previous status
+    cache_key = (request_url, get_api_key())
+    with __status_cache_lock:
+        cached = __status_cache.get(cache_key)
+    headers = {}
+    if (cached is not None):
+        if (cached["etag"] is not None):
+            headers["If-None-Match"] = cached["etag"]
+        if (cached["last_modified"] is not None):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     # do request
-    req = AuroraXRequest(method="get", url=request_url)
+    req = AuroraXRequest(method="get", url=request_url, headers=headers)
     res = req.execute()
 
+    # status hasn't changed
+    if (res.status_code == 304 and cached is not None):
+        with __status_cache_lock:
+            if (cache_key in __status_cache):
+                __status_cache.move_to_end(cache_key)
+        return copy.deepcopy(cached["status"])
+
+    # save the status if the API sent validators for it
+    etag = res.request.headers.get("ETag")
+    last_modified = res.request.headers.get("Last-Modified")
+    with __status_cache_lock:
+        if (etag is not None or last_modified is not None):
+            __status_cache[cache_key] = {
+                "status": res.data,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            __status_cache.move_to_end(cache_key)
+            while (len(__status_cache) > STATUS_CACHE_MAX_SIZE):
+                __status_cache.popitem(last=False)
+        else:
+            __status_cache.pop(cache_key, None)
+
     # return
     return res.data
 
 
+def get_status_batch(request_urls: List[str],
+                     max_workers: Optional[int] = MAX_BATCH_WORKERS) -> List[Dict]:
+    """
+    Retrieve the statuses of several requests at the same time
+
+    Args:
+        request_urls: the URLs of the request information
+        max_workers: max number of statuses retrieved at the same time,
+            defaults to MAX_BATCH_WORKERS
+
+    Returns:
+        the status information for each request, in the same order
+        as the request URLs
+    """
+    # no need for threads if there's only one request
+    if (len(request_urls) <= 1):
+        return [get_status(url) for url in request_urls]
+    if (max_workers is None):
+        max_workers = MAX_BATCH_WORKERS
+
+    # get the statuses concurrently
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(request_urls))) as executor:
+        return list(executor.map(get_status, request_urls))
+
+
 def get_data(data_url: str,
              response_format: Optional[Dict] = None,
              skip_serializing: Optional[bool] = False) -> List:
@@ -75,22 +220,13 @@ def get_data(data_url: str,
 
     # serialize epochs and locations into datetimes and Locations
     if (skip_serializing is False):
-        for i in range(0, len(data_result)):
-            if ("epoch" in data_result[i]):
-                data_result[i]["epoch"] = datetime.datetime.strptime(data_result[i]["epoch"],
-                                                                     "%Y-%m-%dT%H:%M:%S")
-            if ("location_geo" in data_result[i]):
-                data_result[i]["location_geo"] = Location(lat=data_result[i]["location_geo"]["lat"],
-                                                          lon=data_result[i]["location_geo"]["lon"])
-            if ("location_gsm" in data_result[i]):
-                data_result[i]["location_gsm"] = Location(lat=data_result[i]["location_gsm"]["lat"],
-                                                          lon=data_result[i]["location_gsm"]["lon"])
-            if ("nbtrace" in data_result[i]):
-                data_result[i]["nbtrace"] = Location(lat=data_result[i]["nbtrace"]["lat"],
-                                                     lon=data_result[i]["nbtrace"]["lon"])
-            if ("sbtrace" in data_result[i]):
-                data_result[i]["sbtrace"] = Location(lat=data_result[i]["sbtrace"]["lat"],
-                                                     lon=data_result[i]["sbtrace"]["lon"])
+        for record in data_result:
+            if ("epoch" in record):
+                record["epoch"] = __parse_epoch(record["epoch"])
+            for field in LOCATION_FIELDS:
+                location = record.get(field)
+                if (location is not None):
+                    record[field] = Location(lat=location["lat"], lon=location["lon"])
 
     # return
     return data_result
@@ -118,15 +254,22 @@ def get_logs(request_url: str) -> List:
 
 def wait_for_data(request_url: str,
                   poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-                  verbose: Optional[bool] = False) -> Dict:
+                  verbose: Optional[bool] = False,
+                  initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> Dict:
     """
     Block and wait for the data to be made available for a request
 
+    Polling starts quickly (initial_poll_interval) so that short requests
+    return without much delay, and backs off until the time between polling
+    calls reaches the poll_interval.
+
     Args:
         request_url: the URL of the request information
-        poll_interval: seconds to wait between polling calls, defaults
+        poll_interval: max seconds to wait between polling calls, defaults
             to STANDARD_POLLING_SLEEP_TIME
         verbose: output poll times and other progress messages, defaults to False
+        initial_poll_interval: seconds to wait before the first polling call,
+            defaults to FIRST_FOLLOWUP_SLEEP_TIME
 
     Returns:
         the status information for the request
@@ -135,8 +278,9 @@ def wait_for_data(request_url: str,
     status = get_status(request_url)
 
     # wait until request is done
+    sleep_time = __get_first_sleep_time(initial_poll_interval, poll_interval)
     while (status["search_result"]["data_uri"] is None):
-        time.sleep(poll_interval)
+        sleep_time = __poll_sleep(sleep_time, poll_interval)
         if (verbose is True):
             print("[%s] Checking for data ..." % (datetime.datetime.now()))
         status = get_status(request_url)
@@ -147,26 +291,80 @@ def wait_for_data(request_url: str,
     return status
 
 
+def wait_for_data_batch(request_urls: List[str],
+                        poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
+                        verbose: Optional[bool] = False,
+                        initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME,
+                        max_workers: Optional[int] = MAX_BATCH_WORKERS) -> List[Dict]:
+    """
+    Block and wait for the data to be made available for several requests
+
+    This uses a single polling loop for all the requests (instead of calling
+    wait_for_data for each one in its own thread), checking the statuses of
+    the requests that are still running at the same time, and backing off
+    the same way as wait_for_data.
+
+    Args:
+        request_urls: the URLs of the request information
+        poll_interval: max seconds to wait between polling calls, defaults
+            to STANDARD_POLLING_SLEEP_TIME
+        verbose: output poll times and other progress messages, defaults to False
+        initial_poll_interval: seconds to wait before the first polling call,
+            defaults to FIRST_FOLLOWUP_SLEEP_TIME
+        max_workers: max number of statuses retrieved at the same time,
+            defaults to MAX_BATCH_WORKERS
+
+    Returns:
+        the status information for each request, in the same order
+        as the request URLs
+    """
+    # get statuses
+    statuses = get_status_batch(request_urls, max_workers=max_workers)
+
+    # wait until all requests are done, only checking the ones still running
+    sleep_time = __get_first_sleep_time(initial_poll_interval, poll_interval)
+    pending = [i for i, s in enumerate(statuses) if s["search_result"]["data_uri"] is None]
+    while (len(pending) > 0):
+        sleep_time = __poll_sleep(sleep_time, poll_interval)
+        if (verbose is True):
+            print("[%s] Checking for data (%d of %d requests still running) ..." % (datetime.datetime.now(),
+                                                                                    len(pending),
+                                                                                    len(request_urls)))
+        pending_statuses = get_status_batch([request_urls[i] for i in pending], max_workers=max_workers)
+        for i, status in zip(pending, pending_statuses):
+            statuses[i] = status
+        pending = [i for i in pending if statuses[i]["search_result"]["data_uri"] is None]
+
+    # return
+    if (verbose is True):
+        print("[%s] Data is now available" % (datetime.datetime.now()))
+    return statuses
+
+
 def cancel(request_url: str,
            wait: Optional[bool] = False,
            poll_interval: Optional[float] = STANDARD_POLLING_SLEEP_TIME,
-           verbose: Optional[bool] = False) -> int:
+           verbose: Optional[bool] = False,
+           initial_poll_interval: Optional[float] = FIRST_FOLLOWUP_SLEEP_TIME) -> int:
     """
     Cancel the request at the given URL.
 
     This method returns immediately by default since the API processes
     this request asynchronously. If you would prefer to wait for it
     to be completed, set the 'wait' parameter to True. You can adjust
-    the polling time using the 'poll_interval' parameter.
+    the polling time using the 'poll_interval' and 'initial_poll_interval'
+    parameters (polling backs off the same way as wait_for_data).
 
     Args:
         request_url: the URL string of the request to be canceled
         wait: set to True to block until the cancellation request
             has been completed (may wait for several minutes)
-        poll_interval: seconds to wait between polling
+        poll_interval: max seconds to wait between polling
             calls, defaults to STANDARD_POLLING_SLEEP_TIME.
         verbose: if True then output poll times and other
             progress, defaults to False
+        initial_poll_interval: seconds to wait before the first polling call,
+            defaults to FIRST_FOLLOWUP_SLEEP_TIME
 
     Returns:
         1 on success
@@ -181,6 +379,10 @@ def cancel(request_url: str,
                          null_response=True)
     req.execute()
 
+    # the request's status is about to change, so don't re-use it
+    with __status_cache_lock:
+        __status_cache.pop(request_url, None)
+
     # return immediately if we don't want to wait
     if (wait is False):
         return 1
@@ -189,8 +391,9 @@ def cancel(request_url: str,
     status = get_status(request_url)
 
     # wait for request to be cancelled
+    sleep_time = __get_first_sleep_time(initial_poll_interval, poll_interval)
     while (status["search_result"]["data_uri"] is None and status["search_result"]["error_condition"] is False):
-        time.sleep(poll_interval)
+        sleep_time = __poll_sleep(sleep_time, poll_interval)
         if (verbose is True):
             print("[%s] Checking for cancellation status ..." % (datetime.datetime.now()))
         status = get_status(request_url)
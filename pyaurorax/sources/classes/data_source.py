@@ -53,6 +53,25 @@ class DataSource(BaseModel):
     data_product_metadata_schema: Optional[List[Dict]] = None
     format: Optional[str] = FORMAT_FULL_RECORD
 
+    @classmethod
+    def from_dict(cls, data: Dict, format: Optional[str] = FORMAT_FULL_RECORD) -> "DataSource":
+        """
+        Create a DataSource object from a dictionary returned by the AuroraX
+        API, without validating it (much faster when creating many objects)
+
+        Args:
+            data: the data source dictionary
+            format: the format used when printing the data source, defaults
+                to "full_record"
+
+        Returns:
+            a DataSource object
+        """
+        # only keep known fields, since any extra keys sent by the API
+        # aren't dropped like they are when validating
+        return cls.construct(**{k: v for k, v in data.items() if k in cls.__fields__ and k != "format"},
+                             format=format)
+
     def __str__(self) -> str:
         """
         String method
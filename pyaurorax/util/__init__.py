@@ -10,7 +10,9 @@ here instead of digging in deeper to the submodules.
 
 # function and class imports
 from .calculate_btrace import (ground_geo_to_nbtrace,
-                               ground_geo_to_sbtrace)
+                               ground_geo_to_sbtrace,
+                               ground_geo_to_nbtrace_many,
+                               ground_geo_to_sbtrace_many)
 
 # pdoc imports and exports
 from .calculate_btrace import __pdoc__ as __btrace_pdoc__
@@ -18,4 +20,6 @@ __pdoc__ = __btrace_pdoc__
 __all__ = [
     "ground_geo_to_nbtrace",
     "ground_geo_to_sbtrace",
+    "ground_geo_to_nbtrace_many",
+    "ground_geo_to_sbtrace_many",
 ]
@@ -5,24 +5,45 @@ locations for ground-based instruments.
 
 import datetime
 import warnings
-from typing import Dict
+import functools
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple, Sequence, Union, Optional, Any
 from ..location import Location
 
-# import aacgmv2 if installed
-try:
-    import aacgmv2
-    __aacgm_found = True
-except ModuleNotFoundError:
-    __aacgm_found = False
+# check if aacgmv2 is installed (it is only imported when first used, since
+# importing it and numpy slows down importing pyaurorax and starting the CLI)
+__aacgm_found = importlib.util.find_spec("aacgmv2") is not None
 
 # pdoc init
 __pdoc__: Dict = {}
 
+# caching globals
+BTRACE_CACHE_MAX_SIZE: int = 4096
+""" Max number of B-trace calculations (by location and day) kept for re-use """
+
+BTRACE_CACHE_PRECISION: int = 3
+"""
+Number of decimal places locations are rounded to when re-using B-trace
+calculations (3 is roughly 100m)
+"""
+
+
+@functools.lru_cache(maxsize=BTRACE_CACHE_MAX_SIZE)
+def __calculate_btrace_cached(lat: float,
+                              lon: float,
+                              year: int,
+                              month: int,
+                              day: int) -> Tuple[float, float]:
+    import aacgmv2
+
+    # the magnetic model changes slowly, so midday is used for all
+    # timestamps on the same day
+    dt = datetime.datetime(year, month, day, 12, 0, 0)
 
-def __calculate_btrace(geo_location: Location, dt: datetime.datetime) -> Location:
     # convert to magnetic coordinates
-    mag_location = aacgmv2.convert_latlon(geo_location.lat,
-                                          geo_location.lon,
+    mag_location = aacgmv2.convert_latlon(lat,
+                                          lon,
                                           0.0,
                                           dt,
                                           method_code="G2A")
@@ -39,8 +60,111 @@ def __calculate_btrace(geo_location: Location, dt: datetime.datetime) -> Locatio
                                           dt,
                                           method_code="A2G")
 
+    # return
+    return (btrace_aacgm[0], btrace_aacgm[1])
+
+
+def __calculate_btrace(geo_location: Location, dt: datetime.datetime) -> Location:
+    # round the location to ~100m, so that repeated calls for the same
+    # location (ie. a ground station) and day re-use the cached result
+    lat, lon = __calculate_btrace_cached(round(geo_location.lat, BTRACE_CACHE_PRECISION),
+                                         round(geo_location.lon, BTRACE_CACHE_PRECISION),
+                                         dt.year,
+                                         dt.month,
+                                         dt.day)
+
     # return as Location object
-    return Location(lat=btrace_aacgm[0], lon=btrace_aacgm[1])
+    return Location(lat=lat, lon=lon)
+
+
+def __calculate_btrace_many(lats: Any,
+                            lons: Any,
+                            timestamps: Sequence[datetime.datetime]) -> Tuple[Any, Any]:
+    import numpy as np
+    import aacgmv2
+
+    # group the points by day, since aacgmv2 converts arrays of locations
+    # for a single timestamp (midday is used, same as the scalar functions)
+    day_indexes: Dict[Tuple[int, int, int], list] = {}
+    for i, t in enumerate(timestamps):
+        day_indexes.setdefault((t.year, t.month, t.day), []).append(i)
+
+    # convert each day's points in one go
+    out_lats = np.empty(len(lats))
+    out_lons = np.empty(len(lons))
+    for (year, month, day), idx in day_indexes.items():
+        dt = datetime.datetime(year, month, day, 12, 0, 0)
+
+        # convert to magnetic coordinates
+        mag_lats, mag_lons, mag_r = aacgmv2.convert_latlon_arr(lats[idx],
+                                                               lons[idx],
+                                                               np.zeros(len(idx)),
+                                                               dt,
+                                                               method_code="G2A")
+
+        # change magnetic latitude to other hemisphere, and convert
+        # magnetic coordinates back to geographic
+        btrace_lats, btrace_lons, _ = aacgmv2.convert_latlon_arr(mag_lats * -1.0,
+                                                                 mag_lons,
+                                                                 mag_r,
+                                                                 dt,
+                                                                 method_code="A2G")
+        out_lats[idx] = btrace_lats
+        out_lons[idx] = btrace_lons
+
+    # return
+    return out_lats, out_lons
+
+
+def __ground_geo_to_btrace_many(lats: Any,
+                                lons: Any,
+                                timestamps: Union[datetime.datetime, Sequence[datetime.datetime]],
+                                north: bool,
+                                max_workers: Optional[int] = None) -> Tuple[Any, Any]:
+    import numpy as np
+
+    # set up arrays, re-using the timestamp if only one was given
+    out_lats = np.array(lats, dtype=float)
+    out_lons = np.array(lons, dtype=float)
+    if (isinstance(timestamps, datetime.datetime)):
+        timestamps = [timestamps] * len(out_lats)
+    if (len(out_lons) != len(out_lats) or len(timestamps) != len(out_lats)):
+        raise ValueError("The lats, lons, and timestamps must all be the same length")
+
+    # only points in the other hemisphere need converting
+    convert_mask = (out_lats < 0.0) if north is True else (out_lats >= 0.0)
+    idx = np.flatnonzero(convert_mask)
+    if (len(idx) == 0):
+        pass
+    elif (max_workers is None or max_workers <= 1):
+        out_lats[idx], out_lons[idx] = __calculate_btrace_many(out_lats[idx],
+                                                               out_lons[idx],
+                                                               [timestamps[int(i)] for i in idx])
+    else:
+        # split the points into chunks and convert them in separate processes
+        # (aacgmv2 doesn't release the GIL, so threads wouldn't help)
+        chunks = [c for c in np.array_split(idx, max_workers * 4) if len(c) > 0]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(__calculate_btrace_many,
+                                   [out_lats[c] for c in chunks],
+                                   [out_lons[c] for c in chunks],
+                                   [[timestamps[int(i)] for i in c] for c in chunks])
+            for c, (chunk_lats, chunk_lons) in zip(chunks, results):
+                out_lats[c] = chunk_lats
+                out_lons[c] = chunk_lons
+
+    # return
+    return out_lats, out_lons
+
+
+def __unchanged_many(lats: Any, lons: Any) -> Tuple[Any, Any]:
+    # return the unchanged locations as numpy arrays, same as the converted
+    # locations (numpy is installed with aacgmv2, so it may be missing too)
+    try:
+        import numpy as np
+    except ModuleNotFoundError:
+        return list(lats), list(lons)
+    return np.array(lats, dtype=float), np.array(lons, dtype=float)
 
 
 def ground_geo_to_nbtrace(geo_location: Location,
@@ -119,3 +243,89 @@ def ground_geo_to_sbtrace(geo_location: Location,
     # calculate North B-trace and return
     nbtrace = __calculate_btrace(geo_location, timestamp)
     return nbtrace
+
+
+def ground_geo_to_nbtrace_many(lats: Sequence[float],
+                               lons: Sequence[float],
+                               timestamps: Union[datetime.datetime,
+                                                 Sequence[datetime.datetime]],
+                               max_workers: Optional[int] = None) -> Tuple[Any, Any]:
+    """
+    Convert many geographic locations to North B-Trace geographic
+    locations
+
+    This is the same as ground_geo_to_nbtrace, but converts whole arrays
+    of locations (ie. a trajectory or a set of ground stations) at once,
+    which is much faster than converting them one at a time.
+
+    Note: aacgmv2 must be installed. To install it, you can run
+    "python -m pip install pyaurorax[aacgmv2]".
+
+    Args:
+        lats: geographic latitudes (a list or numpy array)
+        lons: geographic longitudes (a list or numpy array)
+        timestamps: a timestamp for each location, or a single timestamp
+            used for all of them
+        max_workers: number of processes to split the conversion across,
+            defaults to None (converted in this process). Only worth using
+            for very large numbers of locations, since starting the processes
+            takes much longer than converting a few thousand locations.
+
+    Returns:
+        the north B-trace latitudes and longitudes, as two numpy arrays
+
+    Raises:
+        ValueError: the lats, lons, and timestamps are different lengths
+    """
+    # check to make sure aacgmv2 is installed
+    if (__aacgm_found is False):
+        warnings.warn("The aacgmv2 package is not installed, so the unchanged "
+                      "locations will be returned. For this function to "
+                      "work, please install it using 'pip install pyaurorax[aacgmv2]'.")
+        return __unchanged_many(lats, lons)
+
+    # calculate and return
+    return __ground_geo_to_btrace_many(lats, lons, timestamps, north=True, max_workers=max_workers)
+
+
+def ground_geo_to_sbtrace_many(lats: Sequence[float],
+                               lons: Sequence[float],
+                               timestamps: Union[datetime.datetime,
+                                                 Sequence[datetime.datetime]],
+                               max_workers: Optional[int] = None) -> Tuple[Any, Any]:
+    """
+    Convert many geographic locations to South B-Trace geographic
+    locations
+
+    This is the same as ground_geo_to_sbtrace, but converts whole arrays
+    of locations (ie. a trajectory or a set of ground stations) at once,
+    which is much faster than converting them one at a time.
+
+    Note: aacgmv2 must be installed. To install it, you can run
+    "python -m pip install pyaurorax[aacgmv2]".
+
+    Args:
+        lats: geographic latitudes (a list or numpy array)
+        lons: geographic longitudes (a list or numpy array)
+        timestamps: a timestamp for each location, or a single timestamp
+            used for all of them
+        max_workers: number of processes to split the conversion across,
+            defaults to None (converted in this process). Only worth using
+            for very large numbers of locations, since starting the processes
+            takes much longer than converting a few thousand locations.
+
+    Returns:
+        the south B-trace latitudes and longitudes, as two numpy arrays
+
+    Raises:
+        ValueError: the lats, lons, and timestamps are different lengths
+    """
+    # check to make sure aacgmv2 is installed
+    if (__aacgm_found is False):
+        warnings.warn("The aacgmv2 package is not installed, so the unchanged "
+                      "locations will be returned. For this function to "
+                      "work, please install it using 'pip install pyaurorax[aacgmv2]'.")
+        return __unchanged_many(lats, lons)
+
+    # calculate and return
+    return __ground_geo_to_btrace_many(lats, lons, timestamps, north=False, max_workers=max_workers)
@@ -98,6 +98,99 @@ def test_conjunctions_search_object_with_advanced_distances():
         assert False
 
 
+@pytest.mark.conjunctions
+def test_conjunctions_search_object_fill_in_advanced_distances():
+    # set up params
+    start = datetime.datetime(2019, 2, 5, 0, 0, 0)
+    end = datetime.datetime(2019, 2, 5, 23, 59, 59)
+    ground_params = [{"programs": ["themis-asi"]}] * 10
+    space_params = [
+        {"programs": ["swarm"]},
+    ]
+    advanced_distances = {
+        "ground10 - space1": 500,
+        "space1-ground1": 200
+    }
+
+    # create object
+    s = pyaurorax.conjunctions.Search(start,
+                                      end,
+                                      advanced_distances,
+                                      ground=ground_params,
+                                      space=space_params)
+
+    # check the distances, missing ones should be filled in with None
+    assert len(s.distance) == 55
+    assert s.distance["ground1-space1"] == 200
+    assert s.distance["ground10-space1"] == 500
+    assert s.distance["ground1-ground10"] is None
+    assert s.distance["ground2-space1"] is None
+
+
+@pytest.mark.conjunctions
+def test_conjunction_from_dict():
+    # set up a conjunction like the API returns it
+    data_source = {
+        "identifier": 1,
+        "program": "themis-asi",
+        "platform": "gillam",
+        "instrument_type": "panchromatic ASI",
+        "source_type": "ground",
+        "display_name": "THEMIS-ASI GILL",
+    }
+    data = {
+        "conjunction_type": "nbtrace",
+        "start": "2020-01-01T00:00:00",
+        "end": "2020-01-01T00:05:00",
+        "data_sources": [pyaurorax.sources.DataSource.from_dict(data_source, format=pyaurorax.FORMAT_BASIC_INFO)],
+        "min_distance": 100.5,
+        "max_distance": 300.25,
+        "events": [],
+    }
+
+    # create the objects with and without validation
+    c = Conjunction.from_dict(data)
+    expected = Conjunction(**data)
+
+    # test them
+    assert c == expected
+    assert c.start == datetime.datetime(2020, 1, 1, 0, 0, 0)
+    assert c.data_sources[0].format == pyaurorax.FORMAT_BASIC_INFO
+    assert c.data_sources[0] == pyaurorax.sources.DataSource(**data_source, format=pyaurorax.FORMAT_BASIC_INFO)
+
+
+@pytest.mark.conjunctions
+def test_conjunction_from_dict_unknown_keys():
+    # set up params, with keys that aren't fields of the objects
+    data_source = {
+        "identifier": 40,
+        "program": "themis-asi",
+        "platform": "gillam",
+        "instrument_type": "panchromatic ASI",
+        "source_type": "ground",
+        "display_name": "THEMIS-ASI GILL",
+        "unknown_key": "value",
+    }
+    data = {
+        "conjunction_type": "nbtrace",
+        "start": "2020-01-01T00:00:00",
+        "end": "2020-01-01T00:05:00",
+        "data_sources": [pyaurorax.sources.DataSource.from_dict(data_source, format=pyaurorax.FORMAT_BASIC_INFO)],
+        "min_distance": 100.5,
+        "max_distance": 300.25,
+        "events": [],
+        "unknown_key": "value",
+    }
+
+    # create the object without validation
+    c = Conjunction.from_dict(data)
+
+    # test that the unknown keys were dropped
+    assert "unknown_key" not in c.dict()
+    assert "unknown_key" not in c.data_sources[0].dict()
+    assert c == Conjunction(**data)
+
+
 @pytest.mark.conjunctions
 @pytest.mark.parametrize("num_ground_blocks,num_space_blocks,num_events_blocks,should_pass",
                          [
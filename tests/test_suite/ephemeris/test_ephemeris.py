@@ -35,6 +35,33 @@ def test_create_ephemeris_object():
         and e.data_source.instrument_type == "test-instrument-type"
 
 
+@pytest.mark.ephemeris
+def test_ephemeris_from_dict():
+    # set values, with a key that isn't a field of the object
+    data_source = pyaurorax.sources.DataSource.from_dict({
+        "identifier": 1,
+        "program": "swarm",
+        "platform": "swarma",
+        "instrument_type": "footprint",
+        "unknown_key": "value",
+    }, format=pyaurorax.FORMAT_BASIC_INFO)
+    data = {
+        "data_source": data_source,
+        "epoch": datetime.datetime(2020, 1, 1, 0, 0),
+        "location_geo": pyaurorax.Location(lat=51.049999, lon=-114.066666),
+        "nbtrace": pyaurorax.Location(lat=1.23, lon=45.6),
+        "sbtrace": pyaurorax.Location(lat=7.89, lon=101.23),
+        "metadata": {},
+        "unknown_key": "value",
+    }
+
+    # create Ephemeris object without validation
+    e = pyaurorax.ephemeris.Ephemeris.from_dict(data)
+
+    assert e == pyaurorax.ephemeris.Ephemeris(**data)
+    assert "unknown_key" not in e.dict() and "unknown_key" not in e.data_source.dict()
+
+
 @pytest.mark.ephemeris
 def test_create_ephemeris_search_object():
     s = pyaurorax.ephemeris.Search(datetime.datetime(2020, 1, 1, 0, 0, 0),
@@ -47,6 +74,33 @@ def test_create_ephemeris_search_object():
         and s.end == datetime.datetime(2020, 1, 10, 0, 0, 0)
 
 
+@pytest.mark.ephemeris
+def test_ephemeris_search_query_in_place_changes():
+    s = pyaurorax.ephemeris.Search(datetime.datetime(2020, 1, 1, 0, 0, 0),
+                                   datetime.datetime(2020, 1, 10, 0, 0, 0),
+                                   programs=[],
+                                   metadata_filters=[])
+    assert s.query["data_sources"]["programs"] == [] \
+        and s.query["data_sources"]["ephemeris_metadata_filters"] == {}
+
+    # change the parameters in place, after the query has been built
+    s.programs.append("swarm")
+    s.metadata_filters.append({"key": "nbtrace_region", "operator": "=", "values": ["north polar cap"]})
+
+    assert s.query["data_sources"]["programs"] == ["swarm"] \
+        and s.query["data_sources"]["ephemeris_metadata_filters"]["expressions"] == s.metadata_filters
+
+
+@pytest.mark.ephemeris
+def test_ephemeris_search_query_with_dates():
+    s = pyaurorax.ephemeris.Search(datetime.date(2020, 1, 1),
+                                   datetime.date(2020, 1, 10),
+                                   programs=["swarm"])
+
+    assert s.query["start"] == "2020-01-01T00:00:00" \
+        and s.query["end"] == "2020-01-10T00:00:00"
+
+
 @pytest.mark.ephemeris
 def test_search_ephemeris_synchronous():
     s = pyaurorax.ephemeris.search(datetime.datetime(2019, 1, 1, 0, 0, 0),
@@ -40,6 +40,26 @@ def test_get_request_status():
     assert status
 
 
+@pytest.mark.requests
+def test_get_request_status_batch():
+    # start searches
+    searches = []
+    for instrument_type in ["footprint", "ssc-web"]:
+        r = pyaurorax.ephemeris.Search(datetime.datetime(2020, 1, 1, 0, 0, 0),
+                                       datetime.datetime(2020, 1, 1, 1, 0, 0),
+                                       programs=["swarm"],
+                                       platforms=["swarma"],
+                                       instrument_types=[instrument_type])
+        r.execute()
+        searches.append(r)
+
+    # get statuses
+    statuses = pyaurorax.requests.get_status_batch([r.request_url for r in searches])
+    assert len(statuses) == len(searches)
+    for status in statuses:
+        assert status
+
+
 @pytest.mark.requests
 def test_get_request_data():
     # start search
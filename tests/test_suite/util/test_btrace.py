@@ -62,3 +62,24 @@ def test_convert_sbtrace_southern():
     sbtrace = pyaurorax.util.ground_geo_to_sbtrace(geo_location, timestamp)
 
     assert np.floor(sbtrace.lat) == -48 and np.floor(sbtrace.lon) == 39
+
+
+@pytest.mark.util
+def test_convert_btrace_many():
+    # set timestamp
+    timestamp = datetime.datetime(2020, 1, 1, 0, 0, 0)
+
+    lats = [56, -56, 62.5]
+    lons = [20, 20, -110]
+
+    # convert all locations at once
+    nbtrace_lats, nbtrace_lons = pyaurorax.util.ground_geo_to_nbtrace_many(lats, lons, timestamp)
+    sbtrace_lats, sbtrace_lons = pyaurorax.util.ground_geo_to_sbtrace_many(lats, lons, [timestamp] * 3)
+
+    # check they match converting the locations one at a time
+    for i in range(0, len(lats)):
+        geo_location = pyaurorax.Location(lat=lats[i], lon=lons[i])
+        nbtrace = pyaurorax.util.ground_geo_to_nbtrace(geo_location, timestamp)
+        sbtrace = pyaurorax.util.ground_geo_to_sbtrace(geo_location, timestamp)
+        assert np.isclose(nbtrace_lats[i], nbtrace.lat, atol=0.01) and np.isclose(nbtrace_lons[i], nbtrace.lon, atol=0.01)
+        assert np.isclose(sbtrace_lats[i], sbtrace.lat, atol=0.01) and np.isclose(sbtrace_lons[i], sbtrace.lon, atol=0.01)